@@ -8,24 +8,32 @@
  *
  * Declares GIL-free safety (Py_MOD_GIL_NOT_USED) for free-threaded Python.
  * The automaton is built once (add_word + make_automaton) then only read
- * during iter() — inherently thread-safe for concurrent readers.
+ * during iter()/match() — inherently thread-safe for concurrent readers.
  *
  * Python API:
  *   ac = AhoCorasick()
- *   ac.add_word(key: str, value: object)
+ *   ac.add_word(key: str, value: object, end_only: bool = False)
  *   ac.make_automaton()
  *   ac.iter(text: str) -> list[tuple[int, object]]
+ *   ac.match(text: str) -> list[object]
+ *
+ * Words added with end_only=True are reported only when the match ends at
+ * the last byte of the text.  The check runs here, against the UTF-8 byte
+ * length, so callers never compare byte offsets with str lengths.
  */
 
 /* Full byte range: 256 children per node (1 KB each).  This trades memory
- * for speed — constant-time transitions in the hot loop.  Acceptable because
+ * for speed — constant-time transitions in the hot loop, and room to bake
+ * the fail links into a dense goto table at build time.  Acceptable because
  * patterns are short, so the trie has few nodes. */
 #define AC_ALPHA 256
 
 typedef struct {
-    int children[AC_ALPHA];
+    int children[AC_ALPHA];  /* trie edges (-1 = none) until make_automaton()
+                                fills every slot: then a complete goto row */
     int fail;         /* failure link: longest proper suffix that is also a prefix in the trie */
     int output;       /* index into values[], -1 = none */
+    int end_output;   /* like output, but only reported at the end of text */
     int dict_suffix;  /* "output link": shortcuts the fail chain to the nearest
                          state with output, avoiding a linear walk per character */
 } ACNode;
@@ -61,6 +69,7 @@ ac_new_node(AhoCorasickObject *self)
     memset(nd->children, 0xff, sizeof(nd->children));
     nd->fail = 0;
     nd->output = -1;
+    nd->end_output = -1;
     nd->dict_suffix = -1;
     return self->n_nodes++;
 }
@@ -81,6 +90,20 @@ ac_new_value(AhoCorasickObject *self, PyObject *val)
     return self->n_values++;
 }
 
+/* UTF-8 view of a str argument for the METH_O lookup methods.  Same
+ * contract as the "s#" converter (str only, cached UTF-8 buffer) without
+ * building and parsing an argument tuple on every hot-path call. */
+static const char *
+ac_text_utf8(PyObject *arg, Py_ssize_t *len)
+{
+    if (!PyUnicode_Check(arg)) {
+        PyErr_Format(PyExc_TypeError, "argument must be str, not %.100s",
+                     Py_TYPE(arg)->tp_name);
+        return NULL;
+    }
+    return PyUnicode_AsUTF8AndSize(arg, len);
+}
+
 /* ------------------------------------------------------------------ */
 /* Type methods                                                       */
 /* ------------------------------------------------------------------ */
@@ -133,7 +156,7 @@ AhoCorasick_dealloc(AhoCorasickObject *self)
 }
 
 /* ------------------------------------------------------------------ */
-/* add_word(key: str, value: object)                                  */
+/* add_word(key: str, value: object, end_only: bool = False)          */
 /* ------------------------------------------------------------------ */
 
 static PyObject *
@@ -142,8 +165,9 @@ AhoCorasick_add_word(AhoCorasickObject *self, PyObject *args)
     const char *key;
     Py_ssize_t key_len;
     PyObject *value;
+    int end_only = 0;
 
-    if (!PyArg_ParseTuple(args, "s#O", &key, &key_len, &value))
+    if (!PyArg_ParseTuple(args, "s#O|p", &key, &key_len, &value, &end_only))
         return NULL;
 
     if (self->built) {
@@ -166,13 +190,16 @@ AhoCorasick_add_word(AhoCorasickObject *self, PyObject *args)
     /* Store value at terminal node */
     int vid = ac_new_value(self, value);
     if (vid < 0) return PyErr_NoMemory();
-    self->nodes[cur].output = vid;
+    if (end_only)
+        self->nodes[cur].end_output = vid;
+    else
+        self->nodes[cur].output = vid;
 
     Py_RETURN_NONE;
 }
 
 /* ------------------------------------------------------------------ */
-/* make_automaton() — build fail + dict_suffix links via BFS          */
+/* make_automaton() — build fail + dict_suffix links, goto table      */
 /* ------------------------------------------------------------------ */
 
 static PyObject *
@@ -191,40 +218,48 @@ AhoCorasick_make_automaton(AhoCorasickObject *self, PyObject *Py_UNUSED(ignored)
     if (!queue) return PyErr_NoMemory();
     int head = 0, tail = 0;
 
-    /* Seed BFS: children of root have fail = 0 */
+    /* Seed BFS: children of root have fail = 0.  Missing root edges loop
+     * back to the root, which makes the root row a complete goto row. */
     for (int c = 0; c < AC_ALPHA; c++) {
         int child = nodes[0].children[c];
         if (child > 0) {
             nodes[child].fail = 0;
             nodes[child].dict_suffix = -1;
             queue[tail++] = child;
+        } else {
+            nodes[0].children[c] = 0;
         }
     }
 
-    /* BFS to compute fail and dict_suffix links (standard Aho-Corasick).
-     * For each node v reached by edge c from parent u:
-     *   fail(v) = longest proper suffix of the string reaching v that
-     *             is also a prefix in the trie.  Found by walking up
-     *             fail(u) until a node with a c-transition is found.
-     *   dict_suffix(v) = nearest node reachable via fail chain that
-     *             has an output, or -1.  Precomputed here to avoid
-     *             linear walks during matching. */
+    /* BFS to compute fail and dict_suffix links (standard Aho-Corasick),
+     * baking the fail links into the goto table as it goes.
+     * For each node u, in BFS order, and each byte c:
+     *   - real edge u -c-> v:
+     *       fail(v) = goto(fail(u), c).  fail(u) is shallower than u, so
+     *                 its row was completed earlier in the BFS.
+     *       dict_suffix(v) = nearest node reachable via fail chain that
+     *                 has an output, or -1.  Precomputed here to avoid
+     *                 linear walks during matching.
+     *   - missing edge:
+     *       goto(u, c) = goto(fail(u), c) — the state a fail-chain walk
+     *                 would reach, so matching never follows fail links.
+     * Rows are only filled when their node is dequeued, so every entry of
+     * row u that is still >= 0 at that point is an original trie edge. */
     while (head < tail) {
         int u = queue[head++];
+        int fu = nodes[u].fail;
         for (int c = 0; c < AC_ALPHA; c++) {
             int v = nodes[u].children[c];
-            if (v < 0) continue;
-
-            /* Walk up the fail chain from parent until we can take edge c */
-            int f = nodes[u].fail;
-            while (f > 0 && nodes[f].children[c] < 0)
-                f = nodes[f].fail;
-            if (nodes[f].children[c] >= 0 && nodes[f].children[c] != v)
-                f = nodes[f].children[c];
+            if (v < 0) {
+                nodes[u].children[c] = nodes[fu].children[c];
+                continue;
+            }
+
+            int f = nodes[fu].children[c];
             nodes[v].fail = f;
 
             /* Compute dict_suffix */
-            if (nodes[f].output >= 0)
+            if (nodes[f].output >= 0 || nodes[f].end_output >= 0)
                 nodes[v].dict_suffix = f;
             else
                 nodes[v].dict_suffix = nodes[f].dict_suffix;
@@ -243,12 +278,11 @@ AhoCorasick_make_automaton(AhoCorasickObject *self, PyObject *Py_UNUSED(ignored)
 /* ------------------------------------------------------------------ */
 
 static PyObject *
-AhoCorasick_iter(AhoCorasickObject *self, PyObject *args)
+AhoCorasick_iter(AhoCorasickObject *self, PyObject *arg)
 {
-    const char *text;
     Py_ssize_t text_len;
-
-    if (!PyArg_ParseTuple(args, "s#", &text, &text_len))
+    const char *text = ac_text_utf8(arg, &text_len);
+    if (!text)
         return NULL;
 
     if (!self->built) {
@@ -266,19 +300,20 @@ AhoCorasick_iter(AhoCorasickObject *self, PyObject *args)
     for (Py_ssize_t i = 0; i < text_len; i++) {
         unsigned char c = (unsigned char)text[i];
 
-        /* Follow fail links until we can advance or reach root */
-        while (state > 0 && nodes[state].children[c] < 0)
-            state = nodes[state].fail;
-        if (nodes[state].children[c] >= 0)
-            state = nodes[state].children[c];
+        /* Fail links are baked into children[] (a complete goto row per
+         * node), so every byte is one table lookup. */
+        state = nodes[state].children[c];
 
         /* Collect outputs from this state + dict_suffix chain */
+        int at_end = (i == text_len - 1);
         int tmp = state;
         while (tmp > 0) {
-            if (nodes[tmp].output >= 0) {
-                int vid = nodes[tmp].output;
+            int vids[2] = {nodes[tmp].output,
+                           at_end ? nodes[tmp].end_output : -1};
+            for (int k = 0; k < 2; k++) {
+                if (vids[k] < 0) continue;
                 PyObject *tuple = Py_BuildValue("(nO)", (Py_ssize_t)i,
-                                                self->values[vid]);
+                                                self->values[vids[k]]);
                 if (!tuple) {
                     Py_DECREF(result);
                     return NULL;
@@ -297,17 +332,73 @@ AhoCorasick_iter(AhoCorasickObject *self, PyObject *args)
     return result;
 }
 
+/* ------------------------------------------------------------------ */
+/* match(text: str) -> list[value]                                    */
+/* ------------------------------------------------------------------ */
+
+/* Same scan as iter(), but returns the matched values only — no
+ * (end_index, value) tuple per hit.  This is the hot-path entry point for
+ * match_all, which never needs positions once end_only filtering happens
+ * here in C. */
+static PyObject *
+AhoCorasick_match(AhoCorasickObject *self, PyObject *arg)
+{
+    Py_ssize_t text_len;
+    const char *text = ac_text_utf8(arg, &text_len);
+    if (!text)
+        return NULL;
+
+    if (!self->built) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "call make_automaton() before match()");
+        return NULL;
+    }
+
+    PyObject *result = PyList_New(0);
+    if (!result) return NULL;
+
+    ACNode *nodes = self->nodes;
+    int state = 0;
+
+    for (Py_ssize_t i = 0; i < text_len; i++) {
+        unsigned char c = (unsigned char)text[i];
+
+        state = nodes[state].children[c];
+
+        int at_end = (i == text_len - 1);
+        int tmp = state;
+        while (tmp > 0) {
+            int vid = nodes[tmp].output;
+            if (vid >= 0 && PyList_Append(result, self->values[vid]) < 0) {
+                Py_DECREF(result);
+                return NULL;
+            }
+            vid = nodes[tmp].end_output;
+            if (at_end && vid >= 0
+                    && PyList_Append(result, self->values[vid]) < 0) {
+                Py_DECREF(result);
+                return NULL;
+            }
+            tmp = nodes[tmp].dict_suffix;
+        }
+    }
+
+    return result;
+}
+
 /* ------------------------------------------------------------------ */
 /* Type definition                                                    */
 /* ------------------------------------------------------------------ */
 
 static PyMethodDef AhoCorasick_methods[] = {
     {"add_word", (PyCFunction)AhoCorasick_add_word, METH_VARARGS,
-     "add_word(key: str, value: object) — insert pattern into trie"},
+     "add_word(key: str, value: object, end_only: bool = False) — insert pattern into trie"},
     {"make_automaton", (PyCFunction)AhoCorasick_make_automaton, METH_NOARGS,
-     "make_automaton() — build failure and dict-suffix links"},
-    {"iter", (PyCFunction)AhoCorasick_iter, METH_VARARGS,
+     "make_automaton() — build failure/dict-suffix links and the goto table"},
+    {"iter", (PyCFunction)AhoCorasick_iter, METH_O,
      "iter(text: str) -> list[(end_index, value)] — find all matches"},
+    {"match", (PyCFunction)AhoCorasick_match, METH_O,
+     "match(text: str) -> list[value] — values of all matches, no positions"},
     {NULL, NULL, 0, NULL}
 };
 
@@ -338,8 +429,8 @@ matcher_exec(PyObject *m)
 }
 
 /* Thread-safety contract: the automaton is built once via add_word +
- * make_automaton (single-threaded), then only read during iter().
- * Concurrent iter() calls are safe since they only read shared state.
+ * make_automaton (single-threaded), then only read during iter()/match().
+ * Concurrent iter()/match() calls are safe since they only read shared state.
  * This justifies Py_MOD_GIL_NOT_USED for free-threaded Python. */
 static PyModuleDef_Slot matcher_slots[] = {
     {Py_mod_exec, matcher_exec},
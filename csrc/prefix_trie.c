@@ -76,6 +76,20 @@ pt_new_value(PrefixTrieObject *self, PyObject *val)
     return self->n_values++;
 }
 
+/* UTF-8 view of a str argument for the METH_O lookup methods.  Same
+ * contract as the "s#" converter (str only, cached UTF-8 buffer) without
+ * building and parsing an argument tuple on every hot-path call. */
+static const char *
+pt_text_utf8(PyObject *arg, Py_ssize_t *len)
+{
+    if (!PyUnicode_Check(arg)) {
+        PyErr_Format(PyExc_TypeError, "argument must be str, not %.100s",
+                     Py_TYPE(arg)->tp_name);
+        return NULL;
+    }
+    return PyUnicode_AsUTF8AndSize(arg, len);
+}
+
 /* ------------------------------------------------------------------ */
 /* Type methods                                                       */
 /* ------------------------------------------------------------------ */
@@ -186,12 +200,11 @@ PrefixTrie_build(PrefixTrieObject *self, PyObject *Py_UNUSED(ignored))
 /* ------------------------------------------------------------------ */
 
 static PyObject *
-PrefixTrie_iter(PrefixTrieObject *self, PyObject *args)
+PrefixTrie_iter(PrefixTrieObject *self, PyObject *arg)
 {
-    const char *text;
     Py_ssize_t text_len;
-
-    if (!PyArg_ParseTuple(args, "s#", &text, &text_len))
+    const char *text = pt_text_utf8(arg, &text_len);
+    if (!text)
         return NULL;
 
     if (!self->built) {
@@ -232,7 +245,7 @@ static PyMethodDef PrefixTrie_methods[] = {
      "add_prefix(key: str, value: object) — insert prefix into trie"},
     {"build", (PyCFunction)PrefixTrie_build, METH_NOARGS,
      "build() — freeze the trie (no more additions)"},
-    {"iter", (PyCFunction)PrefixTrie_iter, METH_VARARGS,
+    {"iter", (PyCFunction)PrefixTrie_iter, METH_O,
      "iter(text: str) -> list[object] — collect all matching prefix values"},
     {NULL, NULL, 0, NULL}
 };
@@ -189,19 +189,30 @@ _build_nodes_from_buf(EntryBuf *buf, long long err_count,
         ScanDirEntry *e = &buf->entries[i];
         PyObject *node;
 
+        /* Basenames repeat heavily across a tree (__init__.py, index.js,
+         * node_modules, ...).  Interning lets every node with the same name
+         * share one str object instead of holding its own copy.  Interned
+         * strings are mortal on 3.13+, so unique names are still freed. */
+        PyObject *name = PyUnicode_FromString(e->name);
+        if (!name) goto error;
+        PyUnicode_InternInPlace(&name);
+
         if (e->is_dir) {
             PyObject *children = PyList_New(0);
-            if (!children) goto error;
-            /* "N" steals the reference to children (transfers ownership).
-             * "O" would increment the refcount, leaking the list. */
-            node = PyObject_CallFunction(ScanNode_cls, "ssOLLN",
-                                         e->path, e->name, kind_dir,
+            if (!children) {
+                Py_DECREF(name);
+                goto error;
+            }
+            /* "N" steals the references to name and children (transfers
+             * ownership).  "O" would increment the refcount, leaking them. */
+            node = PyObject_CallFunction(ScanNode_cls, "sNOLLN",
+                                         e->path, name, kind_dir,
                                          (long long)0, (long long)0, children);
         } else {
             /* "O" borrows leaf (increments refcount) — the shared
              * immutable sentinel is reused across all file nodes. */
-            node = PyObject_CallFunction(ScanNode_cls, "ssOLLO",
-                                         e->path, e->name, kind_file,
+            node = PyObject_CallFunction(ScanNode_cls, "sNOLLO",
+                                         e->path, name, kind_file,
                                          e->size, e->disk_usage, leaf);
         }
 
@@ -1,6 +1,7 @@
 from typing import Any
 
 class AhoCorasick:
-    def add_word(self, key: str, value: Any) -> None: ...
+    def add_word(self, key: str, value: Any, end_only: bool = False) -> None: ...
     def make_automaton(self) -> None: ...
     def iter(self, text: str) -> list[tuple[int, Any]]: ...
+    def match(self, text: str) -> list[Any]: ...
@@ -43,22 +43,36 @@ def _truncate_path(path: str, max_width: int = 110) -> str:
     return f"...{path[-keep:]}"
 
 
-def _render_scan_panel(progress: _ScanProgress, workers: int, phase: str) -> Panel:
-    elapsed = time.perf_counter() - progress.start_time
-    body = Group(
-        Spinner("dots", text=phase, style="bold #8abeb7"),
-        Text.from_markup(f"[#81a2be]Path:[/] {escape(_truncate_path(progress.current_path))}"),
-        Text.from_markup(
-            f"[#b5bd68]Scanned:[/] {progress.directories:,} dirs, {progress.files:,} files"
-            + f"    [#f0c674]Workers:[/] {workers}"
-            + f"    [#de935f]Elapsed:[/] {elapsed:.1f}s"
-        ),
-    )
-    return Panel(
-        body,
-        title="[bold #81a2be]dux - Scanning...[/]",
-        border_style="#373b41",
-    )
+class _ScanPanel:
+    """Live scan panel whose static parts are built once.
+
+    The spinner, title and label styles never change between the ~12 Hz
+    updates.  Each update builds fresh ``Text`` lines (plain ``append``
+    calls, no markup parsing) and a new ``Panel`` around them: ``Live``
+    renders from its own refresh thread, so a renderable it may be drawing
+    is never mutated in place.  Keeping one ``Spinner`` instance lets it
+    animate across updates.
+    """
+
+    __slots__ = ("_spinner", "_title", "_workers")
+
+    def __init__(self, workers: int) -> None:
+        self._workers = str(workers)
+        self._spinner = Spinner("dots", style="bold #8abeb7")
+        self._title = Text.from_markup("[bold #81a2be]dux - Scanning...[/]")
+
+    def update(self, progress: _ScanProgress, phase: str) -> Panel:
+        elapsed = time.perf_counter() - progress.start_time
+        self._spinner.text = phase
+        path = Text("Path:", "#81a2be")
+        path.append(f" {_truncate_path(progress.current_path)}")
+        stats = Text("Scanned:", "#b5bd68")
+        stats.append(f" {progress.directories:,} dirs, {progress.files:,} files    ")
+        stats.append("Workers:", "#f0c674")
+        stats.append(f" {self._workers}    ")
+        stats.append("Elapsed:", "#de935f")
+        stats.append(f" {elapsed:.1f}s")
+        return Panel(Group(self._spinner, path, stats), title=self._title, border_style="#373b41")
 
 
 def _scan_with_progress(path: Path, options: ScanOptions, workers: int, scanner: Scanner) -> ScanResult:
@@ -103,8 +117,9 @@ def _scan_with_progress(path: Path, options: ScanOptions, workers: int, scanner:
     thread = threading.Thread(target=scan_worker, daemon=True)
     thread.start()
 
+    panel = _ScanPanel(workers)
     with Live(
-        _render_scan_panel(progress, workers, "Scanning directory tree..."),
+        panel.update(progress, "Scanning directory tree..."),
         console=console,
         refresh_per_second=12,
         transient=True,
@@ -114,13 +129,13 @@ def _scan_with_progress(path: Path, options: ScanOptions, workers: int, scanner:
             # during rendering (which is slow relative to the lock).
             with lock:
                 snapshot = replace(progress)
-            live.update(_render_scan_panel(snapshot, workers, "Scanning directory tree..."))
+            live.update(panel.update(snapshot, "Scanning directory tree..."))
             # ~12.5 Hz refresh, matching refresh_per_second=12 above.
             time.sleep(0.08)
 
         with lock:
             final = replace(progress)
-        live.update(_render_scan_panel(final, workers, "Finalizing scan..."))
+        live.update(panel.update(final, "Finalizing scan..."))
 
     thread.join()
     if result is None:
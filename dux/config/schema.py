@@ -15,13 +15,15 @@ _INT_FIELDS: tuple[tuple[str, str, int], ...] = (
     ("scrollStep", "scroll_step", 1),
 )
 
+_INT_FIELD_MINIMUMS: dict[str, int] = {attr: minimum for _, attr, minimum in _INT_FIELDS}
+
 
 def clamp_field(value: int, field_name: str) -> int:
     """Clamp *value* to the minimum defined for *field_name* in _INT_FIELDS."""
-    for _, attr, minimum in _INT_FIELDS:
-        if attr == field_name:
-            return max(minimum, value)
-    return value
+    minimum = _INT_FIELD_MINIMUMS.get(field_name)
+    if minimum is None:
+        return value
+    return max(minimum, value)
 
 
 def _get_int(data: dict[str, Any], json_key: str, default: int, minimum: int) -> int:
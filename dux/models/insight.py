@@ -20,7 +20,9 @@ class CategoryStats:
     count: int = 0
     size_bytes: int = 0
     disk_usage: int = 0
-    paths: set[str] = field(default_factory=set)
+    # hash(path) of every matched path: exact enough for de-duplicated counts
+    # without keeping millions of full path strings alive.
+    path_hashes: set[int] = field(default_factory=set)
 
 
 @dataclass(slots=True)
@@ -24,20 +24,19 @@ def default_scanner(workers: int = 4) -> ThreadedScannerBase:
     macOS → NativeScanner (getattrlistbulk).
     GIL enabled → NativeScanner (C readdir, benefits from GIL release during I/O).
     GIL disabled → PythonScanner (true parallelism makes the C overhead negligible).
+    No ``dux._walker`` extension (failed or skipped C build) → PythonScanner.
     """
-    if sys.platform == "darwin":
-        from dux._walker import scan_dir_bulk_nodes
-
-        from dux.scan.native_scanner import NativeScanner
-
-        return NativeScanner(scan_dir_bulk_nodes, workers=workers)
-
-    if sys._is_gil_enabled():  # pyright: ignore[reportPrivateUsage]
-        from dux._walker import scan_dir_nodes
+    if sys.platform == "darwin" or sys._is_gil_enabled():  # pyright: ignore[reportPrivateUsage]
+        try:
+            from dux import _walker
+        except ImportError:
+            return PythonScanner(workers=workers)
 
         from dux.scan.native_scanner import NativeScanner
 
-        return NativeScanner(scan_dir_nodes, workers=workers)
+        if sys.platform == "darwin":
+            return NativeScanner(_walker.scan_dir_bulk_nodes, workers=workers)
+        return NativeScanner(_walker.scan_dir_nodes, workers=workers)
 
     return PythonScanner(workers=workers)
 
@@ -10,8 +10,10 @@
 #   The scan tree is built concurrently, but each directory node is processed
 #   by exactly one worker (guaranteed by the work queue).  Workers append
 #   children to parent.children — since each parent is dequeued by one worker,
-#   there is no concurrent mutation of the same list.  The shared ScanStats
-#   counters are protected by stats_lock via local batching (see run_worker).
+#   there is no concurrent mutation of the same list.  Each worker counts into
+#   its own counter list (see run_worker); progress reads sum those lists and
+#   ScanStats is filled once after all workers are done, so no lock guards
+#   the counters.
 #
 # Lifecycle (scan method):
 #   1. Validate root path → create root ScanNode → enqueue it.
@@ -184,8 +186,12 @@ class ThreadedScannerBase(ABC):
         q = _WorkQueue()
         q.put(_Task(root_node, 0))
 
-        stats = ScanStats(files=0, directories=1, access_errors=0)
-        stats_lock = threading.Lock()
+        num_workers = self._workers
+        # Per-worker [files, dirs, errors] counters.  Each list is written by
+        # its own worker only; other threads just read it for progress, so
+        # the counters need no lock (a read may be slightly stale, which is
+        # fine for an approximate progress total).
+        worker_counts = [[0, 0, 0] for _ in range(num_workers)]
         cancelled = threading.Event()
 
         def _is_cancelled() -> bool:
@@ -199,36 +205,21 @@ class ThreadedScannerBase(ABC):
                 return True
             return False
 
-        def emit_progress(current_path: str, local_files: int, local_dirs: int) -> None:
-            """Report approximate totals: flushed global stats + unflushed local counts."""
+        def emit_progress(current_path: str) -> None:
+            """Report approximate totals summed across all workers' counters."""
             if progress_callback is None:
                 return
-            with stats_lock:
-                f = stats.files + local_files
-                d = stats.directories + local_dirs
-            progress_callback(current_path, f, d)
-
-        def run_worker() -> None:
-            # Workers batch stat updates locally and flush under the shared lock
-            # once per directory (in the finally block).  This reduces lock
-            # contention from once-per-file to once-per-directory.
-            local_files = 0
-            local_dirs = 0
-            local_errors = 0
-
-            def _flush_local() -> None:
-                nonlocal local_files, local_dirs, local_errors
-                if local_files or local_dirs or local_errors:
-                    with stats_lock:
-                        stats.files += local_files
-                        stats.directories += local_dirs
-                        stats.access_errors += local_errors
-                    local_files = local_dirs = local_errors = 0
-
+            files = 0
+            dirs = 1  # the root
+            for counts in worker_counts:
+                files += counts[0]
+                dirs += counts[1]
+            progress_callback(current_path, files, dirs)
+
+        def run_worker(counts: list[int]) -> None:
             while True:
                 task = q.get()
                 if task is None:
-                    _flush_local()
                     break
 
                 if _is_cancelled():
@@ -237,10 +228,10 @@ class ThreadedScannerBase(ABC):
 
                 try:
                     dir_children, files, dirs, errs = self._scan_dir(task.node, task.node.path)
-                    prev_total = local_files + local_dirs
-                    local_files += files
-                    local_dirs += dirs
-                    local_errors += errs
+                    prev_total = counts[0] + counts[1]
+                    counts[0] += files
+                    counts[1] += dirs
+                    counts[2] += errs
 
                     # Depth gate: the current directory is always scanned, but its
                     # subdirectories are only enqueued if we haven't hit max_depth.
@@ -251,20 +242,18 @@ class ThreadedScannerBase(ABC):
 
                     # Emit progress roughly every 100 items (integer division
                     # trick: fires when the count crosses a 100-boundary).
-                    new_total = local_files + local_dirs
+                    new_total = counts[0] + counts[1]
                     if new_total // 100 > prev_total // 100:
-                        emit_progress(task.node.path, local_files, local_dirs)
+                        emit_progress(task.node.path)
                 except Exception:  # noqa: BLE001
                     # Broad catch is intentional: _scan_dir may raise on
                     # permission errors, broken symlinks, etc.  We count
                     # the error and keep the worker alive for other dirs.
-                    local_errors += 1
+                    counts[2] += 1
                 finally:
-                    _flush_local()
                     q.task_done()
 
-        num_workers = self._workers
-        threads = [threading.Thread(target=run_worker, daemon=True) for _ in range(num_workers)]
+        threads = [threading.Thread(target=run_worker, args=(counts,), daemon=True) for counts in worker_counts]
         for thread in threads:
             thread.start()
         # join() waits until all enqueued tasks are done.  Only then do we
@@ -286,7 +275,14 @@ class ThreadedScannerBase(ABC):
                 )
             )
 
-        # All workers are done.  Aggregate child sizes bottom-up and sort
-        # children by disk_usage descending, then freeze into a snapshot.
+        # All workers are done: merge their counters once.
+        stats = ScanStats(
+            files=sum(counts[0] for counts in worker_counts),
+            directories=1 + sum(counts[1] for counts in worker_counts),
+            access_errors=sum(counts[2] for counts in worker_counts),
+        )
+
+        # Aggregate child sizes bottom-up and sort children by disk_usage
+        # descending, then freeze into a snapshot.
         finalize_sizes(root_node)
         return Ok(ScanSnapshot(root=root_node, stats=stats))
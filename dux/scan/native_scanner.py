@@ -4,9 +4,8 @@ from collections.abc import Callable
 from typing import override
 
 from dux.models.enums import NodeKind
-from dux.models.scan import ScanNode
+from dux.models.scan import LEAF_CHILDREN, ScanNode
 from dux.scan._base import ThreadedScannerBase
-from dux.services.tree import LEAF_CHILDREN
 
 # C extension calling convention:
 #   (path, parent_node, leaf_sentinel, kind_dir, kind_file, ScanNode_class)
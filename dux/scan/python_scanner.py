@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from typing import override
 
 from dux.models.scan import ScanNode
@@ -18,13 +19,16 @@ class PythonScanner(ThreadedScannerBase):
             if st is None:
                 errors += 1
                 continue
+            # Basenames repeat heavily across a tree; interning lets nodes
+            # share one str, as the C walker does.
+            name = sys.intern(entry.name)
             if st.is_dir:
-                node = ScanNode.directory(entry.path, entry.name)
+                node = ScanNode.directory(entry.path, name)
                 parent.children.append(node)
                 dir_children.append(node)
                 dirs += 1
             else:
-                node = ScanNode.file(entry.path, entry.name, st.size, st.disk_usage)
+                node = ScanNode.file(entry.path, name, st.size, st.disk_usage)
                 parent.children.append(node)
                 files += 1
         return dir_children, files, dirs, errors
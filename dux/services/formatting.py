@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 UNITS = ["B", "KB", "MB", "GB", "TB", "PB"]
 
 
@@ -17,14 +19,17 @@ def format_bytes(size: int) -> str:
 
 
 def relative_path(absolute_path: str, root_prefix: str) -> str:
-    if absolute_path.startswith(root_prefix):
-        return absolute_path[len(root_prefix) :]
-    return absolute_path
+    return absolute_path.removeprefix(root_prefix)
 
 
 def relative_bar(size: int, total: int, width: int = 16) -> str:
     if width <= 0 or total <= 0:
         return ""
     ratio = min(1.0, max(0.0, size / total))
-    filled = int(round(ratio * width))
+    return _bar(int(round(ratio * width)), width)
+
+
+@lru_cache(maxsize=256)
+def _bar(filled: int, width: int) -> str:
+    # Only width + 1 distinct bars exist per width; build each once.
     return "█" * filled + "░" * max(0, width - filled)
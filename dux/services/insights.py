@@ -1,41 +1,36 @@
 from __future__ import annotations
 
 import heapq
+from operator import attrgetter
 from pathlib import Path
 
 from dux.config.schema import AppConfig, PatternRule
-from dux.models.enums import ApplyTo, InsightCategory
+from dux.models.enums import ApplyTo, InsightCategory, NodeKind
 from dux.models.insight import CategoryStats, Insight, InsightBundle
 from dux.models.scan import ScanNode
-from dux.services.patterns import CompiledRuleSet, compile_ruleset, match_all
+from dux.services.patterns import CompiledRuleSet, compile_ruleset
 
-# Heap entry: (disk_usage, path, Insight).  Using disk usage as the key so the
-# smallest item sits at the top of the min-heap for efficient eviction.
-type _HeapEntry = tuple[int, str, Insight]
+# Top-K candidates are bare Insight objects (no wrapper tuple per match).
+# Selection is always keyed on disk_usage via this C getter, so Insight needs
+# no ordering methods and ties never compare Insight objects.
+_usage_of = attrgetter("disk_usage")
 
+# Enum iteration rebuilds a member list on every pass; freeze it once.
+_CATEGORIES: tuple[InsightCategory, ...] = tuple(InsightCategory)
 
-def _heap_push(
-    heap: list[_HeapEntry],
-    seen: dict[str, int],
-    insight: Insight,
-    max_size: int,
-) -> None:
-    """Push *insight* into a bounded min-heap, deduplicating by path.
+# Categories whose matched directories already account for their whole
+# subtree, so the traversal does not descend into them.
+_PRUNING_CATEGORIES = frozenset({InsightCategory.TEMP, InsightCategory.CACHE})
 
-    The ``seen`` dict tracks the highest disk_usage per path.  Stale entries
-    (lower usage for the same path) may remain in the heap; they are filtered
-    out during the final extraction phase in ``generate_insights``.
+
+def _select_top(entries: list[Insight], max_size: int) -> list[Insight]:
+    """Return the *max_size* largest insights by disk_usage, largest first.
+
+    ``heapq.nlargest`` keeps its bounded heap and all comparisons in C, so a
+    category with many matches costs one C pass per batch instead of a
+    Python-level ``heappush``/``heapreplace`` per match.
     """
-    prev_usage = seen.get(insight.path)
-    if prev_usage is not None:
-        if insight.disk_usage <= prev_usage:
-            return
-    seen[insight.path] = insight.disk_usage
-    entry: _HeapEntry = (insight.disk_usage, insight.path, insight)
-    if len(heap) < max_size:
-        heapq.heappush(heap, entry)
-    elif insight.disk_usage > heap[0][0]:
-        heapq.heapreplace(heap, entry)
+    return heapq.nlargest(max_size, entries, key=_usage_of)
 
 
 def generate_insights(root: ScanNode, config: AppConfig) -> InsightBundle:
@@ -45,10 +40,11 @@ def generate_insights(root: ScanNode, config: AppConfig) -> InsightBundle:
       1. Wrap ``additional_paths`` as synthetic PatternRule objects so they
          go through the same matching pipeline as glob patterns.
       2. Compile all rules into a CompiledRuleSet (fast hash/AC dispatch).
-      3. DFS traversal: match each node, record insights into per-category
-         bounded min-heaps (top-K by disk_usage) and unbounded aggregate
-         counters (for overview totals in the TUI).
-      4. Extract and deduplicate the heaps into a flat sorted list.
+      3. DFS traversal: match each node, append insights to per-category
+         candidate lists (pruned to the top-K by disk_usage in batches) and
+         update unbounded aggregate counters (for overview totals in the TUI).
+      4. Select the top-K per category, deduplicate, and flatten into a
+         sorted list.
     """
     # --- build additional path rules ---
     # Bases are lowercased for case-insensitive matching, consistent with
@@ -76,90 +72,101 @@ def generate_insights(root: ScanNode, config: AppConfig) -> InsightBundle:
         additional_paths=additional_paths or None,
     )
 
-    # --- per-category min-heaps (bounded: top-K for paginated TUI lists) ---
-    heaps: dict[InsightCategory, list[_HeapEntry]] = {cat: [] for cat in InsightCategory}
-    seen: dict[InsightCategory, dict[str, int]] = {cat: {} for cat in InsightCategory}
-
-    # --- aggregate counters (unbounded: totals for overview/status bar) ---
-    by_category: dict[InsightCategory, CategoryStats] = {cat: CategoryStats() for cat in InsightCategory}
-
-    def _record(insight: Insight) -> None:
-        # Update both: by_category sees every match (for accurate totals),
-        # while the heap only keeps the top-K largest (for display).
-        cs = by_category[insight.category]
-        cs.count += 1
-        cs.size_bytes += insight.size_bytes
-        cs.disk_usage += insight.disk_usage
-        cs.paths.add(insight.path)
-        _heap_push(heaps[insight.category], seen[insight.category], insight, config.max_insights_per_category)
+    # --- per-category state, resolved with a single lookup per record ---
+    #   stats:      aggregate counters (unbounded: totals for overview/status bar)
+    #   candidates: top-K candidates for paginated TUI lists.  Appends are
+    #               plain list appends; once the list reaches prune_at it is
+    #               cut back to the top max_size in one _select_top call, so
+    #               memory stays bounded at 2x max_size per category.
+    #   prunes:     True for TEMP and CACHE, whose matched directories are
+    #               not descended into (see in_temp_or_cache below).
+    per_category: dict[InsightCategory, tuple[CategoryStats, list[Insight], bool]] = {
+        cat: (CategoryStats(), [], cat in _PRUNING_CATEGORIES) for cat in _CATEGORIES
+    }
 
     # --- main traversal ---
-    _TEMP = InsightCategory.TEMP
-    _CACHE = InsightCategory.CACHE
-    # Using .value strings because rule.category.value is compared below
-    # (avoids repeated attribute access in the hot loop).
-    _temp_cache = {_TEMP.value, _CACHE.value}
+    # Hoisted out of the loop: each is otherwise a global or attribute
+    # lookup per node (millions of times on large trees).
+    max_size = config.max_insights_per_category
+    prune_at = 2 * max_size
+    directory = NodeKind.DIRECTORY
+    # Per-kind match passes (what match_all dispatches to), bound once.
+    match_dir = ruleset.for_dir.match
+    match_file = ruleset.for_file.match
 
     # The traversal uses two pruning mechanisms:
     #   1. in_temp_or_cache — skips children of dirs already matched as TEMP
     #      or CACHE, because the parent's aggregate size already covers them.
     #   2. stop_recursion (via build_rule) — skips children of dirs like
     #      node_modules to avoid wasting time on uninteresting subtrees.
-    stack: list[tuple[ScanNode, bool]] = [(root, False)]
+    # Pruned children are never pushed, so the stack holds bare nodes
+    # (no per-node (node, flag) tuple) and every popped node is visited.
+    stack: list[ScanNode] = [root]
+    stack_pop = stack.pop
+    stack_extend = stack.extend
     while stack:
-        node, in_temp_or_cache = stack.pop()
-
-        if in_temp_or_cache:
-            continue
+        node = stack_pop()
 
-        path = node.path
-        basename = node.name
-        is_dir = node.is_dir
+        is_dir = node.kind is directory
 
         # Lowercase once per entry for case-insensitive pattern matching.
-        lpath = path.lower()
-        lbase = basename.lower()
+        lpath = node.path.lower()
+        lbase = node.name.lower()
 
         # Single-pass match across all categories
-        matched_rules = match_all(ruleset, lpath, lbase, is_dir)
+        matched_rules = (match_dir if is_dir else match_file)(lpath, lbase)
 
-        local_in_temp_cache = False
+        in_temp_or_cache = False
         build_rule: PatternRule | None = None
         for rule in matched_rules:
-            _record(_insight_from_rule(node, rule))
-            if rule.category.value in _temp_cache:
-                local_in_temp_cache = True
+            # Record inline (no closure call per match).  Stats see every
+            # match (for accurate totals); candidates keep only the top-K
+            # largest (for display).
+            insight = _insight_from_rule(node, rule)
+            cs, candidates, prunes = per_category[insight.category]
+            cs.count += 1
+            cs.size_bytes += insight.size_bytes
+            cs.disk_usage += insight.disk_usage
+            cs.path_hashes.add(hash(insight.path))
+            candidates.append(insight)
+            if len(candidates) >= prune_at:
+                candidates[:] = _select_top(candidates, max_size)
+            if prunes:
+                in_temp_or_cache = True
             if rule.stop_recursion:
                 build_rule = rule
 
-        if is_dir:
-            if build_rule is not None:
-                continue
+        if is_dir and build_rule is None and not in_temp_or_cache:
             # Reverse before pushing onto the LIFO stack so children are
             # visited in their original order (largest disk_usage first).
-            for child in reversed(node.children):
-                stack.append((child, local_in_temp_cache))
-
-    # --- merge heaps into a single sorted list ---
-    # Phase 2 of the lazy dedup strategy (see _heap_push): stale entries
-    # (superseded by a higher-usage entry for the same path) may still be
-    # in the heap.  Sort descending and skip paths already seen to keep
-    # only the freshest.  Cross-category duplicates are kept intentionally
-    # so that filter_insights (per-category view) stays consistent.
+            # A reversed slice lets extend() presize the stack in one
+            # resize; a reversed() iterator grows it item by item.
+            children = node.children
+            if children:
+                stack_extend(children[::-1])
+
+    # --- merge per-category top-K into a single sorted list ---
+    # Each tree node is visited once, so a path appears at most once per
+    # category in practice; the per-category seen set is a cheap guard that
+    # keeps the largest entry if it ever does not.  Cross-category
+    # duplicates are kept intentionally so that filter_insights
+    # (per-category view) stays consistent.
+    # The merged list is sorted with the C attrgetter key; timsort merges
+    # the already-sorted per-category runs in a single pass.
     all_insights: list[Insight] = []
-    for cat in InsightCategory:
+    for cat in _CATEGORIES:
         cat_seen: set[str] = set()
-        entries = sorted(heaps[cat], key=lambda e: e[0], reverse=True)
-        for _, path, insight in entries:
+        for insight in _select_top(per_category[cat][1], max_size):
+            path = insight.path
             if path not in cat_seen:
                 cat_seen.add(path)
                 all_insights.append(insight)
 
-    all_insights.sort(key=lambda x: x.disk_usage, reverse=True)
+    all_insights.sort(key=_usage_of, reverse=True)
 
     return InsightBundle(
         insights=all_insights,
-        by_category=by_category,
+        by_category={cat: state[0] for cat, state in per_category.items()},
     )
 
 
@@ -18,7 +18,7 @@
 #        CONTAINS    **/segment/**      Aho-Corasick on full path
 #        ENDSWITH    **/*.ext           Aho-Corasick (end-only) on full path
 #        STARTSWITH  **/prefix*         PrefixTrie on basename
-#        GLOB        (anything else)    fnmatch fallback
+#        GLOB        (anything else)    compiled regex union per category
 #
 #   3. Bucketing — patterns are split by apply_to (file/dir/both) at
 #      compile time so the hot loop never branches on node kind.
@@ -35,8 +35,8 @@
 #        ENDSWITH  "**/*.log"    -> val=""       (skipped),
 #                                   alt=".log"  (end-of-path only).
 #                                   Since lpath ends with the basename,
-#                                   end_idx == len(lpath)-1 is equivalent
-#                                   to basename.endswith(suffix).
+#                                   a hit ending at the last byte of lpath
+#                                   is equivalent to basename.endswith(suffix).
 #
 #      _build_ac skips empty keys, so ENDSWITH entries produce only an
 #      end-only key while CONTAINS entries produce both.
@@ -48,28 +48,52 @@
 #   most one rule per category (first match wins):
 #
 #     1. EXACT             — O(1) dict lookup on lbase.
-#     2. CONTAINS+ENDSWITH — single ac.iter(lpath) call. Hits flagged
-#                            end_only=True are accepted only when
-#                            end_idx == len(lpath) - 1.
+#     2. CONTAINS+ENDSWITH — single ac.match(lpath) call. Keys added
+#                            with end_only=True are reported by the C
+#                            automaton only when they end at the last
+#                            byte of lpath.
 #     3. STARTSWITH        — PrefixTrie walk on lbase, O(basename length).
-#     4. GLOB              — fnmatch fallback.
+#     4. GLOB              — one fullmatch per category over a compiled
+#                            union of that category's glob patterns.
 #     5. Additional paths  — literal path prefix checks for user-configured
-#                            directories (e.g. ~/.cache).
+#                            directories (e.g. ~/.cache), one tuple
+#                            startswith call per category.
 
 from __future__ import annotations
 
+import re
+import sys
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from fnmatch import fnmatch
+from fnmatch import translate
+from functools import lru_cache
 
 from dux._ac_matcher import AhoCorasick
 from dux._prefix_trie import PrefixTrie
 
 from dux.config.schema import PatternRule
-from dux.models.enums import ApplyTo
+from dux.models.enums import ApplyTo, InsightCategory
 
 _FILE = ApplyTo.FILE
 _DIR = ApplyTo.DIR
 
+# One bit per category: match_all dedups with an int bitmask instead of a
+# per-call set of category strings.
+_CATEGORY_BIT: dict[InsightCategory, int] = {cat: 1 << i for i, cat in enumerate(InsightCategory)}
+
+# A rule paired with its category bit, resolved once at compile time.
+type _TaggedRule = tuple[int, PatternRule]
+
+# (category_bit, union regex, rules): branch i of the union is rules[i - 1].
+type _GlobGroup = tuple[int, re.Pattern[str], tuple[PatternRule, ...]]
+
+# (category_bit, bases, base_dirs, entries) for one category's additional
+# paths: base_dirs is each base + "/", entries pairs them with their rules.
+type _AdditionalGroup = tuple[int, frozenset[str], tuple[str, ...], tuple[tuple[str, str, PatternRule], ...]]
+
+# Match pass for one node kind: (lpath, lbase) -> matched rules.
+type _MatchFn = Callable[[str, str], list[PatternRule]]
+
 # Matcher kinds — integers for fast dispatch in the hot loop.
 _CONTAINS = 0  # "/segment/" in path  (for **/segment/**)
 _ENDSWITH = 1  # basename.endswith(v) (for **/*.ext)
@@ -133,30 +157,86 @@ def _classify(pattern: str) -> _Matcher:
 
 
 def _expand_braces(pattern: str) -> tuple[str, ...]:
-    start = pattern.find("{")
-    end = pattern.find("}", start + 1)
-    if start == -1 or end == -1:
+    """Expand ``{a,b}`` groups left to right, e.g. "*.{a,b}" -> ("*.a", "*.b").
+
+    Iterative worklist: each round expands the first remaining group of every
+    pattern, which yields the same order as a depth-first recursion.
+    """
+    if "{" not in pattern:
         return (pattern,)
-    choices = pattern[start + 1 : end].split(",")
-    prefix = pattern[:start]
-    suffix = pattern[end + 1 :]
-    expanded: list[str] = []
-    for choice in choices:
-        expanded.extend(_expand_braces(f"{prefix}{choice}{suffix}"))
-    return tuple(expanded)
+    out = [pattern]
+    changed = True
+    while changed:
+        changed = False
+        expanded: list[str] = []
+        for p in out:
+            start = p.find("{")
+            end = p.find("}", start + 1)
+            if start == -1 or end == -1:
+                expanded.append(p)
+                continue
+            changed = True
+            prefix = p[:start]
+            suffix = p[end + 1 :]
+            expanded.extend(f"{prefix}{choice}{suffix}" for choice in p[start + 1 : end].split(","))
+        out = expanded
+    return tuple(out)
+
+
+# End-of-string anchor that fnmatch.translate() appends to every pattern.
+_END_ANCHOR = re.compile(r"\\[Zz]\Z")
+
+
+def _glob_regex(pattern: str) -> str:
+    """Translate a glob pattern into a regex over ``"<path>\\x00<basename>"``.
+
+    The pattern matches if it matches the full path or the basename.  A
+    pattern like "foo/bar/**" also matches "foo/bar" itself (the directory),
+    not just its descendants, so the path side also tries it without the
+    trailing "/**".  Paths never contain NUL, so the single ``\\x00`` in the
+    subject pins each side to its own half.
+    """
+    # translate() anchors with a trailing \Z (\z on newer Pythons); the path
+    # side is followed by the separator, so drop the anchor there.
+    path_side = _END_ANCHOR.sub("", translate(pattern))
+    if pattern.endswith("/**"):
+        base_side = _END_ANCHOR.sub("", translate(pattern[: -len("/**")]))
+        path_side = f"{base_side}|{path_side}"
+    return rf"(?:{path_side})\x00(?s:.*)|(?s:.*)\x00{translate(pattern)}"
 
 
-def _match_pattern_slow(pattern: str, normalized_path: str, basename: str) -> bool:
-    """Fallback for patterns that can't be classified into simple string ops."""
-    if pattern.endswith("/**"):
-        # A pattern like "foo/bar/**" should match "foo/bar" itself (the
-        # directory), not just its descendants.  Try without the trailing "/**".
-        base_pattern = pattern[: -len("/**")]
-        if fnmatch(normalized_path, base_pattern):
-            return True
-    if fnmatch(normalized_path, pattern):
-        return True
-    return fnmatch(basename, pattern)
+def _build_glob_groups(entries: list[tuple[str, _TaggedRule]]) -> list[_GlobGroup]:
+    """Compile GLOB entries into one regex union per category.
+
+    Each entry becomes a capturing branch, in rule order, so ``m.lastindex``
+    identifies the first rule of the category that matched.  A single union
+    across categories would stop at the first branch and hide matches from
+    other categories, hence one union per category bit.
+    """
+    grouped: dict[int, list[tuple[str, PatternRule]]] = {}
+    for pattern, (bit, rule) in entries:
+        grouped.setdefault(bit, []).append((pattern, rule))
+    groups: list[_GlobGroup] = []
+    for bit, items in grouped.items():
+        union = "|".join(f"({_glob_regex(pattern)})" for pattern, _ in items)
+        groups.append((bit, re.compile(union), tuple(rule for _, rule in items)))
+    return groups
+
+
+def _group_additional(entries: list[tuple[str, _TaggedRule]]) -> list[_AdditionalGroup]:
+    """Group additional-path entries per category for one-call prefix tests.
+
+    ``str.startswith`` accepts a tuple, so a single C call rejects a path
+    against every base of a category; the entries are only walked (in rule
+    order, so the first configured base wins) once that call hits.
+    """
+    grouped: dict[int, list[tuple[str, str, PatternRule]]] = {}
+    for base, (bit, rule) in entries:
+        grouped.setdefault(bit, []).append((base, base + "/", rule))
+    return [
+        (bit, frozenset(base for base, _, _ in items), tuple(base_dir for _, base_dir, _ in items), tuple(items))
+        for bit, items in grouped.items()
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -165,41 +245,42 @@ def _match_pattern_slow(pattern: str, normalized_path: str, basename: str) -> bo
 
 
 def _build_ac(
-    entries: list[tuple[str, str, PatternRule]],
+    entries: list[tuple[str, str, _TaggedRule]],
 ) -> AhoCorasick | None:
     """Build an Aho-Corasick automaton from CONTAINS and ENDSWITH entries.
 
     Each entry is (val, alt, rule).  *val* is an any-position substring
     (empty for ENDSWITH-only entries); *alt* is an end-of-string-only suffix.
-    The automaton value for each key is ``list[tuple[PatternRule, bool]]``
-    where the bool means *end_only*.
+    Rules are grouped per ``(key, end_only)`` and each group is stored as a
+    ``list[_TaggedRule]`` value.  The automaton enforces *end_only* itself,
+    so ``ac.match`` only ever returns groups that really matched.
     """
     if not entries:
         return None
-    patterns: dict[str, list[tuple[PatternRule, bool]]] = {}
+    patterns: dict[tuple[str, bool], list[_TaggedRule]] = {}
     for val, alt, rule in entries:
         if val:
-            patterns.setdefault(val, []).append((rule, False))
+            patterns.setdefault((val, False), []).append(rule)
         if alt:
-            patterns.setdefault(alt, []).append((rule, True))
+            patterns.setdefault((alt, True), []).append(rule)
     ac = AhoCorasick()
-    for key, value in patterns.items():
-        ac.add_word(key, value)
+    for (key, end_only), rules in patterns.items():
+        ac.add_word(key, rules, end_only)
     ac.make_automaton()
     return ac
 
 
 def _build_prefix_trie(
-    entries: list[tuple[str, PatternRule]],
+    entries: list[tuple[str, _TaggedRule]],
 ) -> PrefixTrie | None:
     """Build a PrefixTrie from STARTSWITH entries.
 
     Groups rules by prefix key so that overlapping prefixes (e.g. "npm" and
-    "npm-debug") each store a ``list[PatternRule]`` as their value.
+    "npm-debug") each store a ``list[_TaggedRule]`` as their value.
     """
     if not entries:
         return None
-    grouped: dict[str, list[PatternRule]] = {}
+    grouped: dict[str, list[_TaggedRule]] = {}
     for prefix, rule in entries:
         grouped.setdefault(prefix, []).append(rule)
     pt = PrefixTrie()
@@ -209,28 +290,115 @@ def _build_prefix_trie(
     return pt
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class _ByKind:
-    """All pattern rules for one node kind (file or dir), indexed by matcher kind."""
+    """All pattern rules for one node kind (file or dir), indexed by matcher kind.
 
-    exact: dict[str, list[PatternRule]] = field(default_factory=dict)
+    Every rule is stored as a ``(category_bit, rule)`` pair.
+    """
+
+    exact: dict[str, list[_TaggedRule]] = field(default_factory=dict)
     ac: AhoCorasick | None = None
     prefix_trie: PrefixTrie | None = None
-    glob: list[tuple[str, PatternRule]] = field(default_factory=list)
-    additional: list[tuple[str, PatternRule]] = field(default_factory=list)
+    glob: list[_GlobGroup] = field(default_factory=list)
+    additional: list[tuple[str, _TaggedRule]] = field(default_factory=list)
+    # Specialized match pass over the tables above, built once per kind.
+    match: _MatchFn = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen, so the matcher can never go stale against its tables.
+        object.__setattr__(self, "match", _make_matcher(self))
+
+
+def _make_matcher(bk: _ByKind) -> _MatchFn:
+    """Specialize the match pass for one node kind.
+
+    Perf: the matcher runs once per node during the insight traversal
+    (millions of times on large trees).  Every table it needs is bound once
+    here as a closure variable, so the hot body does no attribute lookups on
+    *bk*, and tiers with no rules are skipped by a single ``None`` test.
+    The first-match-per-category check is inlined at every tier to avoid a
+    closure allocation per call.
+    """
+    exact_get = bk.exact.get
+    ac_match = bk.ac.match if bk.ac is not None else None
+    prefix_iter = bk.prefix_trie.iter if bk.prefix_trie is not None else None
+    glob = bk.glob or None
+    additional = _group_additional(bk.additional) or None
+
+    def match(lpath: str, lbase: str) -> list[PatternRule]:
+        matched: list[PatternRule] = []
+        seen = 0
+
+        # Inline first-match-per-category gatekeeper at every tier below.
+        # Each block checks the rule's category bit against the `seen`
+        # bitmask before appending — once a category has a hit, later
+        # matches are skipped.
+
+        # --- EXACT: O(1) dict lookup ---
+        hits = exact_get(lbase)
+        if hits:
+            for bit, rule in hits:
+                if not seen & bit:
+                    seen |= bit
+                    matched.append(rule)
+
+        # --- CONTAINS + ENDSWITH: Aho-Corasick automaton ---
+        # A single ac.match() call finds all CONTAINS and ENDSWITH matches.
+        # end_only keys (set at compile time in _build_ac) are reported by
+        # the automaton only when the match ends at the last byte of the
+        # path, so the "match at end of path" check never leaves C.
+        if ac_match is not None:
+            for rules in ac_match(lpath):
+                for bit, rule in rules:
+                    if not seen & bit:
+                        seen |= bit
+                        matched.append(rule)
+
+        # --- STARTSWITH: PrefixTrie ---
+        if prefix_iter is not None:
+            for rules in prefix_iter(lbase):
+                for bit, rule in rules:
+                    if not seen & bit:
+                        seen |= bit
+                        matched.append(rule)
+
+        # --- GLOB: one compiled union per category ---
+        if glob is not None:
+            subject = f"{lpath}\x00{lbase}"
+            for bit, union, rules in glob:
+                if not seen & bit:
+                    m = union.fullmatch(subject)
+                    if m is not None and m.lastindex:
+                        seen |= bit
+                        matched.append(rules[m.lastindex - 1])
+
+        # --- Additional paths (pre-normalized, lowercased) ---
+        if additional is not None:
+            for bit, bases, base_dirs, entries in additional:
+                if not seen & bit and (lpath in bases or lpath.startswith(base_dirs)):
+                    seen |= bit
+                    for base, base_dir, rule in entries:
+                        if lpath == base or lpath.startswith(base_dir):
+                            matched.append(rule)
+                            break
+
+        return matched
+
+    return match
 
 
 @dataclass(slots=True)
 class _ByKindBuilder:
     """Accumulates pattern entries for one node kind during compilation."""
 
-    exact: dict[str, list[PatternRule]] = field(default_factory=dict)
-    ac_entries: list[tuple[str, str, PatternRule]] = field(default_factory=list)
-    startswith: list[tuple[str, PatternRule]] = field(default_factory=list)
-    glob: list[tuple[str, PatternRule]] = field(default_factory=list)
-    additional: list[tuple[str, PatternRule]] = field(default_factory=list)
+    exact: dict[str, list[_TaggedRule]] = field(default_factory=dict)
+    ac_entries: list[tuple[str, str, _TaggedRule]] = field(default_factory=list)
+    startswith: list[tuple[str, _TaggedRule]] = field(default_factory=list)
+    glob: list[tuple[str, _TaggedRule]] = field(default_factory=list)
+    additional: list[tuple[str, _TaggedRule]] = field(default_factory=list)
 
-    def add(self, m: _Matcher, rule: PatternRule) -> None:
+    def add(self, m: _Matcher, rule: _TaggedRule) -> None:
         if m.kind == _EXACT:
             self.exact.setdefault(m.value, []).append(rule)
         elif m.kind == _CONTAINS:
@@ -249,7 +417,7 @@ class _ByKindBuilder:
             exact=self.exact,
             ac=_build_ac(self.ac_entries),
             prefix_trie=_build_prefix_trie(self.startswith),
-            glob=self.glob,
+            glob=_build_glob_groups(self.glob),
             additional=self.additional,
         )
 
@@ -262,6 +430,23 @@ class CompiledRuleSet:
     for_dir: _ByKind = field(default_factory=_ByKind)
 
 
+# Hashable snapshot of a PatternRule, in field order: _rule_from_key(key)
+# rebuilds an equal rule.
+type _RuleKey = tuple[str, str, InsightCategory, ApplyTo, bool]
+type _RulesetKey = tuple[tuple[_RuleKey, ...], tuple[tuple[str, _RuleKey], ...]]
+
+
+def _rule_key(rule: PatternRule) -> _RuleKey:
+    return (rule.name, rule.pattern, rule.category, rule.apply_to, rule.stop_recursion)
+
+
+def _rule_from_key(key: _RuleKey) -> PatternRule:
+    # The name becomes Insight.summary for every match; interning it lets
+    # all insights from equally named rules share one string.
+    name, pattern, category, apply_to, stop_recursion = key
+    return PatternRule(sys.intern(name), pattern, category, apply_to, stop_recursion)
+
+
 def compile_ruleset(
     rules: list[PatternRule],
     additional_paths: list[tuple[str, PatternRule]] | None = None,
@@ -273,24 +458,51 @@ def compile_ruleset(
     loop never branches on apply_to.
 
     *additional_paths* are pre-normalized (base_path, rule) pairs.
+
+    Results are memoized on the rules' field values, so repeated calls with
+    the same configuration (e.g. one generate_insights per scanned root)
+    reuse the built automata.  The cached ruleset owns private copies of the
+    rules; ``match_all`` returns those copies, which compare equal to the
+    originals, so later mutation of the caller's rules cannot leak into it.
     """
+    key: _RulesetKey = (
+        tuple(_rule_key(rule) for rule in rules),
+        tuple((base, _rule_key(rule)) for base, rule in additional_paths or ()),
+    )
+    return _compile_ruleset_cached(key)
+
+
+@lru_cache(maxsize=8)
+def _compile_ruleset_cached(key: _RulesetKey) -> CompiledRuleSet:
+    rule_keys, additional_keys = key
+    return _compile_ruleset(
+        [_rule_from_key(rule_key) for rule_key in rule_keys],
+        [(base, _rule_from_key(rule_key)) for base, rule_key in additional_keys],
+    )
+
+
+def _compile_ruleset(
+    rules: list[PatternRule],
+    additional_paths: list[tuple[str, PatternRule]],
+) -> CompiledRuleSet:
     builders = {_FILE: _ByKindBuilder(), _DIR: _ByKindBuilder()}
 
     for rule in rules:
         at = rule.apply_to
+        tagged: _TaggedRule = (_CATEGORY_BIT[rule.category], rule)
         for expanded_pat in _expand_braces(rule.pattern):
             m = _classify(expanded_pat)
             # IntFlag bitwise test: BOTH (= FILE | DIR) distributes
             # the rule into both builders in a single loop iteration.
             for flag, b in builders.items():
                 if at & flag:
-                    b.add(m, rule)
+                    b.add(m, tagged)
 
-    if additional_paths:
-        for base, rule in additional_paths:
-            for flag, b in builders.items():
-                if rule.apply_to & flag:
-                    b.additional.append((base, rule))
+    for base, rule in additional_paths:
+        tagged = (_CATEGORY_BIT[rule.category], rule)
+        for flag, b in builders.items():
+            if rule.apply_to & flag:
+                b.additional.append((base, tagged))
 
     return CompiledRuleSet(
         for_file=builders[_FILE].build(),
@@ -311,69 +523,8 @@ def match_all(
 
     Returns at most one rule per category (first match wins).
 
-    Perf: this function is called once per node during the insight traversal
-    (millions of times on large trees).  The first-match-per-category check
-    is inlined at every tier to avoid a closure allocation per call.
+    Hot loops should call ``rs.for_dir.match`` / ``rs.for_file.match``
+    directly (see _make_matcher) to skip this dispatch.
     """
     bk = rs.for_dir if is_dir else rs.for_file
-    matched: list[PatternRule] = []
-    seen: set[str] = set()
-
-    # Inline first-match-per-category gatekeeper at every tier below.
-    # Avoids a closure allocation per match_all call (called millions of
-    # times on large trees).  Each block checks `cat not in seen` before
-    # appending — once a category has a hit, later matches are skipped.
-
-    # --- EXACT: O(1) dict lookup ---
-    hits = bk.exact.get(lbase)
-    if hits:
-        for rule in hits:
-            cat = rule.category.value
-            if cat not in seen:
-                seen.add(cat)
-                matched.append(rule)
-
-    # --- CONTAINS + ENDSWITH: Aho-Corasick automaton ---
-    # A single ac.iter() call finds all CONTAINS and ENDSWITH matches.
-    # end_only=True (set at compile time in _build_ac) restricts ENDSWITH
-    # and CONTAINS-alt hits to fire only when the match ends at the last
-    # character of the path — this is the runtime enforcement of the
-    # "match at end of path" semantic.
-    if bk.ac is not None:
-        _lpath_end = len(lpath) - 1
-        for end_idx, entries in bk.ac.iter(lpath):
-            for rule, end_only in entries:
-                if end_only and end_idx != _lpath_end:
-                    continue
-                cat = rule.category.value
-                if cat not in seen:
-                    seen.add(cat)
-                    matched.append(rule)
-
-    # --- STARTSWITH: PrefixTrie ---
-    if bk.prefix_trie is not None:
-        for rules in bk.prefix_trie.iter(lbase):
-            for rule in rules:
-                cat = rule.category.value
-                if cat not in seen:
-                    seen.add(cat)
-                    matched.append(rule)
-
-    # --- GLOB fallback ---
-    for pat, rule in bk.glob:
-        if _match_pattern_slow(pat, lpath, lbase):
-            cat = rule.category.value
-            if cat not in seen:
-                seen.add(cat)
-                matched.append(rule)
-
-    # --- Additional paths (pre-normalized, lowercased) ---
-    if bk.additional:
-        for base, rule in bk.additional:
-            if lpath == base or lpath.startswith(base + "/"):
-                cat = rule.category.value
-                if cat not in seen:
-                    seen.add(cat)
-                    matched.append(rule)
-
-    return matched
+    return bk.match(lpath, lbase)
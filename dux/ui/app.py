@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import os
 import shlex
+import shutil
 import subprocess
 import sys
+import threading
+import time
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Callable, override
 
 from rich.markup import escape
@@ -11,14 +16,18 @@ from rich.text import Text
 from textual import on
 from textual.app import App, ComposeResult
 from textual.containers import Container, Vertical
+from textual.geometry import Size
 from textual.screen import ModalScreen
+from textual.timer import Timer
 from textual.widgets import DataTable, Input, Static
+from textual.worker import get_current_worker
 
 from dux.config.schema import AppConfig
 from dux.models.enums import InsightCategory, NodeKind
 from dux.models.insight import CategoryStats, InsightBundle
 from dux.models.scan import ScanNode, ScanStats
 from dux.services.formatting import format_bytes, relative_bar
+from dux.services.tree import top_nodes
 from dux.ui.views import (
     DisplayRow,
     browse_rows,
@@ -39,12 +48,96 @@ _TAB_LABELS: dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=len(TABS))
+def _tab_bar(active: str) -> Text:
+    """Tab bar with *active* highlighted; parsed once per tab, then reused."""
+    tab_items: list[str] = []
+    for tab in TABS:
+        label = _TAB_LABELS.get(tab, tab)
+        if tab == active:
+            tab_items.append(f"[bold #1d1f21 on #b5bd68] {label} [/] ")
+        else:
+            tab_items.append(f"[#c5c8c6 on #373b41] {label} [/] ")
+    return Text.from_markup(" ".join(tab_items))
+
+
+# Keys recognized by their character regardless of the reported key name.
+_CHAR_KEYS: dict[str, str] = {
+    "g": "g",
+    "G": "G",
+    "Y": "Y",
+    "[": "left_square_bracket",
+    "]": "right_square_bracket",
+}
+
 _PAGED_VIEWS = {"temp", "large_dir", "large_file"}
 
 _TEMP_CATEGORIES = frozenset({InsightCategory.TEMP, InsightCategory.CACHE, InsightCategory.BUILD_ARTIFACT})
 
 _EMPTY_STATS = CategoryStats()
 
+_CLIPBOARD_COMMANDS: dict[str, list[str]] = {
+    "darwin": ["pbcopy"],
+    "win32": ["clip"],
+}
+
+
+def _native_clipboard_command() -> list[str] | None:
+    """Return the local clipboard command to use, or None for OSC 52.
+
+    Over SSH a local tool would fill the remote host's clipboard, so the
+    terminal escape sequence is used instead; it is also the fallback when
+    no tool is installed.  Resolved once per app, not per yank.
+    """
+    if "SSH_TTY" in os.environ or "SSH_CONNECTION" in os.environ:
+        return None
+    cmd = _CLIPBOARD_COMMANDS.get(sys.platform, ["xclip", "-selection", "clipboard"])
+    exe = shutil.which(cmd[0])
+    return [exe, *cmd[1:]] if exe is not None else None
+
+
+# Sizes repeat heavily across rows (block-aligned files, re-renders of the
+# same view), and format_bytes is pure, so table cells go through a cache.
+_format_size = lru_cache(maxsize=4096)(format_bytes)
+
+
+def _distinct_count(sets: list[set[int]]) -> int:
+    """Return ``len(set().union(*sets))`` without copying when possible.
+
+    The temp categories rarely share paths, and ``isdisjoint`` only walks
+    the smaller set without allocating, so the union copy is skipped in
+    the common case.
+    """
+    if all(a.isdisjoint(b) for i, a in enumerate(sets) for b in sets[i + 1 :]):
+        return sum(map(len, sets))
+    return len(set().union(*sets))
+
+
+def _table_cells(rows: list[DisplayRow], is_temp: bool, apparent_size: bool, total: int) -> list[tuple[str, ...]]:
+    """Format the content-table cells for *rows*, one tuple per row.
+
+    The column layout is chosen once per call rather than per row, and
+    the result is handed to ``DataTable.add_rows`` in one batch.
+    """
+    fmt = _format_size
+
+    def size_cell(value: int) -> str:
+        return fmt(value) if value > 0 else ""
+
+    if is_temp:
+        if apparent_size:
+            return [
+                (r.name, size_cell(r.size_bytes), size_cell(r.disk_usage), r.type_label, r.category or "") for r in rows
+            ]
+        return [(r.name, size_cell(r.disk_usage), r.type_label, r.category or "") for r in rows]
+
+    def bar_cell(value: int) -> str:
+        return relative_bar(value, total, 18) if value > 0 else ""
+
+    if apparent_size:
+        return [(r.name, size_cell(r.size_bytes), size_cell(r.disk_usage), bar_cell(r.disk_usage)) for r in rows]
+    return [(r.name, size_cell(r.disk_usage), bar_cell(r.disk_usage)) for r in rows]
+
 
 class _PagedState:
     """Pagination state for views with potentially large row counts.
@@ -71,6 +164,12 @@ class _FilteredRowsCache:
     source_rows: list[DisplayRow]
     filter_text: str
     rows: list[DisplayRow]
+    # Lowercased (name, path) per source row, built on the first non-empty
+    # filter and carried over while source_rows stays the same list.
+    lowered: list[tuple[str, str]] | None = None
+    # Indices into source_rows of ``rows`` (None when unfiltered).  A filter
+    # that extends this one only needs to re-check these rows.
+    matches: list[int] | None = None
 
 
 @dataclass(slots=True)
@@ -247,9 +346,10 @@ class DuxApp(App[None]):
         self._top_n_limit = config.max_insights_per_category
         self._root_prefix = root.path.rstrip("/") + "/"
 
-        self.node_by_path: dict[str, ScanNode] = {}
-        self.parent_by_path: dict[str, str] = {}
-        self._index_tree(self.root)
+        # Filled lazily by _lookup_node, one directory's children at a time,
+        # so startup does not walk the whole tree.
+        self.node_by_path: dict[str, ScanNode] = {self.root.path: self.root}
+        self._indexed_dirs: set[str] = set()
 
         self.browse_root_path = self.root.path
         self.expanded: set[str] = {self.root.path}
@@ -257,19 +357,65 @@ class DuxApp(App[None]):
         self.rows: list[DisplayRow] = []
         self.selected_index = 0
         self.pending_g = False
+        self._pending_g_deadline = 0.0
         self._views: dict[str, _ViewState] = {
             v: _ViewState(paged=_PagedState() if v in _PAGED_VIEWS else None) for v in TABS
         }
-
-    def _index_tree(self, root: ScanNode) -> None:
-        stack: list[tuple[ScanNode, str | None]] = [(root, None)]
-        while stack:
-            node, parent = stack.pop()
-            self.node_by_path[node.path] = node
-            if parent is not None:
-                self.parent_by_path[node.path] = parent
-            for child in node.children:
-                stack.append((child, node.path))
+        # Resize events are coalesced into one refresh once the size settles.
+        self._last_size = Size(0, 0)
+        self._resize_timer: Timer | None = None
+        self._clipboard_cmd = _native_clipboard_command()
+        self._footer_status: str | None = None
+        self._key_handlers: dict[str, Callable[[], object]] = {}
+        self._page_keys: dict[str, Callable[[], object]] = {}
+        self._browse_keys: dict[str, Callable[[], object]] = {}
+        self._build_key_tables()
+        self._path_row: Text | None = None
+        self._top_nodes_cache: dict[NodeKind, list[ScanNode]] = {}
+        self._top_nodes_lock = threading.Lock()
+        # path -> first row index for the last row list searched by _row_index.
+        self._row_index_cache: tuple[list[DisplayRow], dict[str, int]] | None = None
+        # (label, width) per column of the content table as last rendered.
+        self._table_columns: tuple[tuple[str, int], ...] = ()
+
+    def _lookup_node(self, path: str) -> ScanNode | None:
+        """Return the node at *path*, indexing directories along the way.
+
+        On a miss, walks down from the root one path segment at a time and
+        indexes the children of each directory it passes through (once per
+        directory), so only directories the user actually reaches are ever
+        indexed.
+        """
+        node_by_path = self.node_by_path
+        node = node_by_path.get(path)
+        if node is not None:
+            return node
+        if not path.startswith(self._root_prefix):
+            return None
+        indexed = self._indexed_dirs
+        node = self.root
+        for part in path[len(self._root_prefix) :].split("/"):
+            if node.path not in indexed:
+                indexed.add(node.path)
+                for child in node.children:
+                    node_by_path[child.path] = child
+            found = node_by_path.get(f"{node.path}/{part}" if node.path != "/" else f"/{part}")
+            if found is None:
+                return None
+            node = found
+        return node
+
+    def _parent_path(self, path: str) -> str | None:
+        """Return the path of *path*'s parent node, or None for the scan root.
+
+        Child paths are always ``parent.path + "/" + name`` (children of "/"
+        are "/name"), so the parent is derived from the string instead of
+        being indexed for every node.
+        """
+        if path == self.root.path:
+            return None
+        parent = path.rpartition("/")[0] or "/"
+        return parent if self._lookup_node(parent) is not None else None
 
     @override
     def compose(self) -> ComposeResult:
@@ -288,13 +434,60 @@ class DuxApp(App[None]):
         table.cursor_type = "row"
         table.zebra_stripes = True
         table.focus()
+        self._last_size = self.size
         self._refresh_all()
+        self.run_worker(self._prewarm_paged_views, thread=True, exclusive=False, group="prewarm")
+
+    def _prewarm_paged_views(self) -> None:
+        """Build the paged views' rows off the UI thread (runs in a worker).
+
+        ``top_nodes`` walks the whole tree, so building these lazily on the
+        first Tab switch stalls the UI.  Rows are computed here from the
+        read-only scan tree and handed back to the UI thread, which installs
+        them; views built or invalidated in the meantime are left alone.
+        """
+        worker = get_current_worker()
+        for view in TABS:
+            state = self._views[view].paged
+            if state is None or state.all_rows is not None:
+                continue
+            rows, total_items = self._build_all_paged_rows(view)
+            if worker.is_cancelled:
+                return
+            self.call_from_thread(self._install_paged_rows, view, state, rows, total_items)
+
+    def _install_paged_rows(self, view: str, state: _PagedState, rows: list[DisplayRow], total_items: int) -> None:
+        if self._views[view].paged is not state or state.all_rows is not None:
+            return
+        state.all_rows, state.total_items = rows, total_items
+        if view == self.current_view:
+            self._refresh_content()
 
     def on_resize(self) -> None:
+        # Dragging a terminal border fires a burst of resize events; each
+        # refresh rebuilds the whole table, so wait for the size to settle.
+        if self._resize_timer is not None:
+            self._resize_timer.stop()
+            self._resize_timer = None
+        if self.size == self._last_size:
+            return
+        self._resize_timer = self.set_timer(0.05, self._on_resize_settled)
+
+    def _on_resize_settled(self) -> None:
+        self._resize_timer = None
+        self._last_size = self.size
         self._refresh_all()
 
     def _refresh_all(self) -> None:
         self._render_header_rows()
+        self._refresh_content()
+
+    def _refresh_content(self) -> None:
+        """Re-render the table and footer, leaving the header rows alone.
+
+        The header only changes with the active view, so page flips, filter
+        changes and tree expansion within a view skip it.
+        """
         self._render_content_table()
         self._render_footer_rows()
 
@@ -309,20 +502,13 @@ class DuxApp(App[None]):
         self._invalidate_rows("browse")
 
     def _render_header_rows(self) -> None:
-        self.query_one("#path-row", Static).update(Text.from_markup(f"[#81a2be]Path:[/] {escape(self.root.path)}"))
-
-        tab_items: list[str] = []
-        for tab in TABS:
-            label = _TAB_LABELS.get(tab, tab)
-            if tab == self.current_view:
-                tab_items.append(f"[bold #1d1f21 on #b5bd68] {label} [/] ")
-            else:
-                tab_items.append(f"[#c5c8c6 on #373b41] {label} [/] ")
-        self.query_one("#tabs-row", Static).update(Text.from_markup(" ".join(tab_items)))
+        if self._path_row is None:
+            self._path_row = Text.from_markup(f"[#81a2be]Path:[/] {escape(self.root.path)}")
+            self.query_one("#path-row", Static).update(self._path_row)
+        self.query_one("#tabs-row", Static).update(_tab_bar(self.current_view))
 
     def _render_content_table(self) -> None:
         table = self.query_one("#content-table", DataTable)
-        table.clear(columns=True)
 
         col_w = 12
         bar_w = 20
@@ -333,21 +519,30 @@ class DuxApp(App[None]):
         extra = (col_w + 2) if self._apparent_size else 0
 
         is_temp = self.current_view == "temp"
+        columns: list[tuple[str, int]] = []
         if is_temp:
             name_w = max(20, self.size.width - extra - col_w - type_w - cat_w - 16)
-            table.add_column("NAME", width=name_w)
+            columns.append(("NAME", name_w))
             if self._apparent_size:
-                table.add_column("SIZE", width=col_w)
-            table.add_column("DISK", width=col_w)
-            table.add_column("TYPE", width=type_w)
-            table.add_column("CATEGORY", width=cat_w)
+                columns.append(("SIZE", col_w))
+            columns += [("DISK", col_w), ("TYPE", type_w), ("CATEGORY", cat_w)]
         else:
             name_w = max(20, self.size.width - extra - col_w - bar_w - 12)
-            table.add_column("NAME", width=name_w)
+            columns.append(("NAME", name_w))
             if self._apparent_size:
-                table.add_column("SIZE", width=col_w)
-            table.add_column("DISK", width=col_w)
-            table.add_column("BAR", width=bar_w)
+                columns.append(("SIZE", col_w))
+            columns += [("DISK", col_w), ("BAR", bar_w)]
+
+        # Columns are only rebuilt when their labels or widths change
+        # (view switch into/out of temp, or a width change).
+        column_spec = tuple(columns)
+        if column_spec == self._table_columns:
+            table.clear()
+        else:
+            table.clear(columns=True)
+            for label, width in column_spec:
+                table.add_column(label, width=width)
+            self._table_columns = column_spec
 
         self.rows = self._build_rows_for_current_view()
         if not self.rows:
@@ -360,18 +555,7 @@ class DuxApp(App[None]):
             1,
             self.rows[0].disk_usage if self.current_view == "browse" else self.root.disk_usage,
         )
-        for row in self.rows:
-            disk_text = format_bytes(row.disk_usage) if row.disk_usage > 0 else ""
-            size_text = format_bytes(row.size_bytes) if row.size_bytes > 0 else ""
-            cells: list[str] = [row.name]
-            if self._apparent_size:
-                cells.append(size_text)
-            if is_temp:
-                cells.extend([disk_text, row.type_label, row.category or ""])
-            else:
-                bar_text = relative_bar(row.disk_usage, total, 18) if row.disk_usage > 0 else ""
-                cells.extend([disk_text, bar_text])
-            table.add_row(*cells)
+        table.add_rows(_table_cells(self.rows, is_temp, self._apparent_size, total))
 
         self.selected_index = max(0, min(self.selected_index, len(self.rows) - 1))
         table.move_cursor(row=self.selected_index, animate=False)
@@ -399,13 +583,13 @@ class DuxApp(App[None]):
         if trimmed_text:
             left += f" | {trimmed_text}"
         if active_filter:
-            left += f" | Filter: '{escape(active_filter)}'"
+            left += f" | Filter: '{active_filter}'"
 
         hints = "q quit | ? help | Tab views | / search | y yank path | Y yank name"
         if self.current_view == "browse":
             hints += " | h/l collapse/expand | Enter/Backspace drill-in/out"
         if paged_total > self._page_size:
-            hints += " | \\[/] prev/next page"
+            hints += " | [/] prev/next page"
         if active_filter:
             hints += " | Esc clear filter"
 
@@ -421,7 +605,11 @@ class DuxApp(App[None]):
             pad = width - len(left) - len(hints)
             status = left + " " * max(gap, pad) + hints
 
-        self.query_one("#status-row", Static).update(Text.from_markup(f"[#969896]{status}[/]"))
+        # Plain styled Text (no markup parse), and no widget update at all
+        # when a keypress leaves the footer unchanged.
+        if status != self._footer_status:
+            self._footer_status = status
+            self.query_one("#status-row", Static).update(Text(status, style="#969896"))
 
     def _build_rows_for_current_view(self) -> list[DisplayRow]:
         vs = self._views[self.current_view]
@@ -458,8 +646,7 @@ class DuxApp(App[None]):
         if view == "temp":
             rows = self._insight_rows(lambda i: i.category in _TEMP_CATEGORIES)
             bc = self.bundle.by_category
-            total_items = len(set().union(*(bc.get(cat, _EMPTY_STATS).paths for cat in _TEMP_CATEGORIES)))
-            return rows, total_items
+            return rows, _distinct_count([bc.get(cat, _EMPTY_STATS).path_hashes for cat in _TEMP_CATEGORIES])
         if view == "large_dir":
             rows = self._top_nodes_rows(NodeKind.DIRECTORY)
             return rows, max(0, self.stats.directories - 1)
@@ -481,7 +668,7 @@ class DuxApp(App[None]):
             return
         vs.paged.page_index += 1
         self.selected_index = 0
-        self._refresh_all()
+        self._refresh_content()
 
     def _prev_page(self) -> None:
         vs = self._views[self.current_view]
@@ -491,7 +678,7 @@ class DuxApp(App[None]):
             return
         vs.paged.page_index -= 1
         self.selected_index = 0
-        self._refresh_all()
+        self._refresh_content()
 
     def _trimmed_indicator(self, view: str) -> str:
         vs = self._views[view]
@@ -516,31 +703,77 @@ class DuxApp(App[None]):
         if cached is not None and cached.source_rows is rows and cached.filter_text == filter_text:
             return cached.rows
 
+        same_source = cached is not None and cached.source_rows is rows
+        # Lowercase each row once per row list, not once per filter change.
+        lowered = cached.lowered if cached is not None and same_source else None
+        matches: list[int] | None = None
         if not filter_text:
             filtered = rows
         else:
+            if lowered is None:
+                lowered = [(r.name.lower(), r.path.lower()) for r in rows]
             needle = filter_text.lower()
-            filtered = [r for r in rows if needle in r.name.lower() or needle in r.path.lower()]
+            # Narrowing: when the previous needle is a substring of this one
+            # (typically a prefix being extended), every row matching this
+            # needle also matched the previous one, so only the previous
+            # matches are re-checked.
+            if (
+                cached is not None
+                and same_source
+                and cached.matches is not None
+                and cached.filter_text.lower() in needle
+            ):
+                candidates: range | list[int] = cached.matches
+            else:
+                candidates = range(len(rows))
+            matches = [i for i in candidates if needle in lowered[i][0] or needle in lowered[i][1]]
+            filtered = [rows[i] for i in matches]
 
         vs.filtered_cache = _FilteredRowsCache(
             source_rows=rows,
             filter_text=filter_text,
             rows=filtered,
+            lowered=lowered,
+            matches=matches,
         )
         return filtered
 
     def _overview_rows(self) -> list[DisplayRow]:
-        return overview_rows(self.root, self.stats, self.bundle.by_category, self._overview_top, self._root_prefix)
+        return overview_rows(
+            self.root,
+            self.stats,
+            self.bundle.by_category,
+            self._overview_top,
+            self._root_prefix,
+            top_dirs=self._top_nodes(NodeKind.DIRECTORY),
+        )
 
     def _browse_rows(self) -> list[DisplayRow]:
-        browse_root = self.node_by_path.get(self.browse_root_path, self.root)
+        browse_root = self._lookup_node(self.browse_root_path) or self.root
         return browse_rows(browse_root, self.expanded)
 
     def _insight_rows(self, predicate: Callable[..., bool]) -> list[DisplayRow]:
-        return insight_rows(self.bundle.insights, self.node_by_path, self._root_prefix, predicate)
+        return insight_rows(self.bundle.insights, self._root_prefix, predicate)
 
     def _top_nodes_rows(self, kind: NodeKind) -> list[DisplayRow]:
-        return top_nodes_rows(self.root, self._top_n_limit, kind, self._root_prefix)
+        return top_nodes_rows(self._top_nodes(kind)[: self._top_n_limit], self._root_prefix)
+
+    def _top_nodes(self, kind: NodeKind) -> list[ScanNode]:
+        """Largest nodes of *kind*, computed once for every view that lists them.
+
+        One walk with the larger of the overview and top-N limits serves
+        both the overview and the large_dir/large_file views, which slice
+        it.  The walk runs outside the lock so the UI thread never waits on
+        the prewarm worker's walk; if both race, the first published list
+        wins and every caller sees the same object.
+        """
+        with self._top_nodes_lock:
+            nodes = self._top_nodes_cache.get(kind)
+        if nodes is not None:
+            return nodes
+        nodes = top_nodes(self.root, max(self._overview_top, self._top_n_limit), kind)
+        with self._top_nodes_lock:
+            return self._top_nodes_cache.setdefault(kind, nodes)
 
     def _set_view(self, view: str) -> None:
         if view not in TABS:
@@ -612,7 +845,7 @@ class DuxApp(App[None]):
         path = self._selected_path()
         if path is None:
             return
-        node = self.node_by_path.get(path)
+        node = self._lookup_node(path)
         if node is None or node.kind is not NodeKind.DIRECTORY:
             return
         if path in self.expanded:
@@ -620,7 +853,7 @@ class DuxApp(App[None]):
         else:
             self.expanded.add(path)
         self._invalidate_browse_rows()
-        self._refresh_all()
+        self._refresh_content()
 
     def _collapse_or_parent(self) -> None:
         """Vim-tree 'h' key: collapse if expanded, otherwise jump to parent."""
@@ -631,7 +864,7 @@ class DuxApp(App[None]):
             return
 
         # Phase 1: if the node is an expanded directory, collapse it.
-        node = self.node_by_path.get(path)
+        node = self._lookup_node(path)
         if (
             node is not None
             and node.kind is NodeKind.DIRECTORY
@@ -640,18 +873,17 @@ class DuxApp(App[None]):
         ):
             self.expanded.remove(path)
             self._invalidate_browse_rows()
-            self._refresh_all()
+            self._refresh_content()
             return
 
         # Phase 2: already collapsed (or a file) — move cursor to parent.
-        parent = self.parent_by_path.get(path)
+        parent = self._parent_path(path)
         if parent is None:
             return
-        for index, row in enumerate(self.rows):
-            if row.path == parent:
-                self.selected_index = index
-                break
-        self._refresh_all()
+        # The listing itself is unchanged, so only the cursor moves.
+        index = self._row_index(self.rows, parent)
+        if index is not None:
+            self._move_selection(index - self.selected_index)
 
     def _expand_or_drill(self) -> None:
         """Vim-tree 'l' key: expand if collapsed, drill in if already expanded."""
@@ -660,21 +892,35 @@ class DuxApp(App[None]):
         path = self._selected_path()
         if path is None:
             return
-        node = self.node_by_path.get(path)
+        node = self._lookup_node(path)
         if node is None or node.kind is not NodeKind.DIRECTORY:
             return
 
         if path not in self.expanded:
             self.expanded.add(path)
             self._invalidate_browse_rows()
-            self._refresh_all()
+            self._refresh_content()
             return
 
         self.browse_root_path = path
         self.expanded.add(path)
         self.selected_index = 0
         self._invalidate_browse_rows()
-        self._refresh_all()
+        self._refresh_content()
+
+    def _row_index(self, rows: list[DisplayRow], path: str) -> int | None:
+        """Return the index of the first row in *rows* with *path*.
+
+        The path map is built on first use and kept while *rows* is the
+        same list object (row lists are replaced, never mutated), so
+        repeated h/Backspace presses on one listing are dict lookups.
+        """
+        cached = self._row_index_cache
+        if cached is None or cached[0] is not rows:
+            # Walk backwards so the first occurrence of a path wins.
+            index_by_path = {rows[i].path: i for i in range(len(rows) - 1, -1, -1)}
+            cached = self._row_index_cache = (rows, index_by_path)
+        return cached[1].get(path)
 
     def _drill_out(self) -> None:
         """Move browse root up to parent, repositioning cursor on the old root."""
@@ -682,7 +928,7 @@ class DuxApp(App[None]):
             return
         if self.browse_root_path == self.root.path:
             return
-        parent = self.parent_by_path.get(self.browse_root_path)
+        parent = self._parent_path(self.browse_root_path)
         if parent is None:
             return
         old_root = self.browse_root_path
@@ -691,19 +937,17 @@ class DuxApp(App[None]):
         self._invalidate_browse_rows()
         # Rebuild rows for the new root, then place cursor on the directory
         # we just drilled out of so the user doesn't lose context.
-        for idx, row in enumerate(self._build_rows_for_current_view()):
-            if row.path == old_root:
-                self.selected_index = idx
-                break
-        self._refresh_all()
+        index = self._row_index(self._build_rows_for_current_view(), old_root)
+        if index is not None:
+            self.selected_index = index
+        self._refresh_content()
 
     def _copy_to_clipboard(self, text: str) -> bool:
-        if sys.platform == "darwin":
-            cmd = ["pbcopy"]
-        elif sys.platform == "win32":
-            cmd = ["clip"]
-        else:
-            cmd = ["xclip", "-selection", "clipboard"]
+        cmd = self._clipboard_cmd
+        if cmd is None:
+            # OSC 52: the terminal sets the clipboard, no process spawned.
+            self.copy_to_clipboard(text)
+            return True
         try:
             subprocess.run(cmd, input=text.encode(), check=True)  # noqa: S603
             return True
@@ -727,130 +971,112 @@ class DuxApp(App[None]):
             self.selected_index = event.cursor_row
             self._render_footer_rows()
 
-    def _handle_global_key(self, key: str) -> bool:
-        if key in {"q", "ctrl+c"}:
-            self.exit()
-            return True
-        if key == "question_mark":
-            self.push_screen(HelpOverlay())
-            return True
-        if key == "tab":
-            self._set_view(TABS[(TABS.index(self.current_view) + 1) % len(TABS)])
-            return True
-        if key in {"shift+tab", "backtab"}:
-            self._set_view(TABS[(TABS.index(self.current_view) - 1) % len(TABS)])
-            return True
-        if key in {"o", "b", "t", "d", "f"}:
-            mapping = {
-                "o": "overview",
-                "b": "browse",
-                "t": "temp",
-                "d": "large_dir",
-                "f": "large_file",
-            }
-            self._set_view(mapping[key])
-            return True
-        if key == "slash":
-            current = self._views[self.current_view].filter_text
-            self.push_screen(SearchOverlay(current), self._on_search_result)
-            return True
-        return False
+    def _build_key_tables(self) -> None:
+        """Map key names to handlers, once per app instead of per keystroke.
 
-    def _handle_navigation_key(self, key: str, char: str) -> bool:
-        if key == "j":
-            self._move_selection(1)
-            return True
-        if key == "k":
-            self._move_selection(-1)
-            return True
-        if key in {"ctrl+d", "pagedown"}:
-            self._move_selection(self._scroll_step)
-            return True
-        if key in {"ctrl+u", "pageup"}:
-            self._move_selection(-self._scroll_step)
-            return True
-        if key in {"home", "ctrl+home"}:
-            self._move_top()
-            return True
-        if key in {"end", "ctrl+end"}:
-            self._move_bottom()
-            return True
-        # Vim-style gg: double-tap g within 500ms to jump to top.
-        # A timer resets pending_g if the second g doesn't arrive in time.
-        if key == "g" or char == "g":
-            if self.pending_g:
-                self.pending_g = False
-                self._move_top()
-            else:
-                self.pending_g = True
-                self.set_timer(0.5, lambda: setattr(self, "pending_g", False))
-            return True
-        if key in {"G", "shift+g"} or char == "G":
-            self._move_bottom()
-            return True
-        return False
+        ``_key_handlers`` holds the global, yank and navigation keys (their
+        key names never overlap); paging and browse keys only apply in some
+        views, so they get their own tables.
+        """
+        self._key_handlers = {
+            # global
+            "q": self.exit,
+            "ctrl+c": self.exit,
+            "question_mark": lambda: self.push_screen(HelpOverlay()),
+            "tab": lambda: self._cycle_view(1),
+            "shift+tab": lambda: self._cycle_view(-1),
+            "backtab": lambda: self._cycle_view(-1),
+            "o": lambda: self._set_view("overview"),
+            "b": lambda: self._set_view("browse"),
+            "t": lambda: self._set_view("temp"),
+            "d": lambda: self._set_view("large_dir"),
+            "f": lambda: self._set_view("large_file"),
+            "slash": self._open_search,
+            # yank
+            "y": lambda: self._yank(lambda row: shlex.quote(row.path) if row.path else shlex.quote(row.name)),
+            "Y": lambda: self._yank(lambda row: shlex.quote(row.name)),
+            "shift+y": lambda: self._yank(lambda row: shlex.quote(row.name)),
+            # navigation
+            "j": lambda: self._move_selection(1),
+            "k": lambda: self._move_selection(-1),
+            "ctrl+d": lambda: self._move_selection(self._scroll_step),
+            "pagedown": lambda: self._move_selection(self._scroll_step),
+            "ctrl+u": lambda: self._move_selection(-self._scroll_step),
+            "pageup": lambda: self._move_selection(-self._scroll_step),
+            "home": self._move_top,
+            "ctrl+home": self._move_top,
+            "end": self._move_bottom,
+            "ctrl+end": self._move_bottom,
+            "g": self._press_g,
+            "G": self._move_bottom,
+            "shift+g": self._move_bottom,
+        }
+        self._page_keys = {
+            "left_square_bracket": self._prev_page,
+            "right_square_bracket": self._next_page,
+        }
+        self._browse_keys = {
+            "h": self._collapse_or_parent,
+            "left": self._collapse_or_parent,
+            "l": self._expand_or_drill,
+            "right": self._expand_or_drill,
+            "enter": self._expand_or_drill,
+            "space": self._toggle_expand,
+            "backspace": self._drill_out,
+        }
 
-    def _handle_browse_key(self, key: str) -> bool:
-        if key in {"h", "left"}:
-            self._collapse_or_parent()
-            return True
-        if key in {"l", "right"}:
-            self._expand_or_drill()
-            return True
-        if key == "space":
-            self._toggle_expand()
-            return True
-        if key == "enter":
-            self._expand_or_drill()
-            return True
-        if key == "backspace":
-            self._drill_out()
-            return True
-        return False
+    def _cycle_view(self, step: int) -> None:
+        self._set_view(TABS[(TABS.index(self.current_view) + step) % len(TABS)])
 
-    def _reset_view_position(self) -> None:
-        self.selected_index = 0
+    def _open_search(self) -> None:
+        current = self._views[self.current_view].filter_text
+        self.push_screen(SearchOverlay(current), self._on_search_result)
+
+    def _press_g(self) -> None:
+        # Vim-style gg: double-tap g within 500ms to jump to top.
+        # The first g records a deadline; no timer is needed to expire it.
+        now = time.monotonic()
+        if self.pending_g and now < self._pending_g_deadline:
+            self.pending_g = False
+            self._move_top()
+        else:
+            self.pending_g = True
+            self._pending_g_deadline = now + 0.5
+
+    def _set_filter(self, text: str) -> None:
+        """Apply *text* as the current view's filter and return to its top."""
         vs = self._views[self.current_view]
+        vs.filter_text = text
+        self.selected_index = 0
         if vs.paged is not None:
             vs.paged.page_index = 0
-        self._refresh_all()
+        self._refresh_content()
 
     def _on_search_result(self, value: str | None) -> None:
-        self._views[self.current_view].filter_text = value or ""
-        self._reset_view_position()
+        self._set_filter(value or "")
 
     @override
     def on_key(self, event) -> None:  # type: ignore[override]
-        """Central key dispatch.  Priority: escape → global → yank →
-        navigation → pagination → browse.  First handler to match wins."""
+        """Central key dispatch.  Priority: escape → global/yank/navigation
+        → pagination → browse, each a dict lookup in its key table."""
         key = event.key
         char = event.character or ""
 
         if key == "escape":
-            vs = self._views[self.current_view]
-            if vs.filter_text:
-                vs.filter_text = ""
-                self._reset_view_position()
+            if self._views[self.current_view].filter_text:
+                self._set_filter("")
             return
 
-        if self._handle_global_key(key):
-            return
-        if key == "y":
-            self._yank(lambda row: shlex.quote(row.path) if row.path else shlex.quote(row.name))
-            return
-        if key in {"Y", "shift+y"} or char == "Y":
-            self._yank(lambda row: shlex.quote(row.name))
-            return
-        if self._handle_navigation_key(key, char):
-            return
-        vs = self._views[self.current_view]
-        if vs.paged is not None and vs.paged.total_rows > self._page_size:
-            if key == "left_square_bracket" or char == "[":
-                self._prev_page()
-                return
-            if key == "right_square_bracket" or char == "]":
-                self._next_page()
-                return
+        # Some terminals report these by character only (e.g. "G" with an
+        # unexpected key name), so the character picks the table key.
+        key = _CHAR_KEYS.get(char, key or "")
 
-        if self.current_view == "browse" and self._handle_browse_key(key):
-            return
+        handler = self._key_handlers.get(key)
+        if handler is None:
+            vs = self._views[self.current_view]
+            if vs.paged is not None and vs.paged.total_rows > self._page_size:
+                handler = self._page_keys.get(key)
+            if handler is None and self.current_view == "browse":
+                handler = self._browse_keys.get(key)
+        if handler is not None:
+            handler()
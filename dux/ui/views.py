@@ -6,7 +6,7 @@ from typing import Callable
 from dux.models.enums import InsightCategory, NodeKind
 from dux.models.insight import CategoryStats, Insight
 from dux.models.scan import ScanNode, ScanStats
-from dux.services.formatting import format_bytes, relative_path
+from dux.services.formatting import format_bytes
 from dux.services.tree import top_nodes
 
 
@@ -35,7 +35,13 @@ def overview_rows(
     by_category: dict[InsightCategory, CategoryStats],
     overview_top: int,
     root_prefix: str,
+    top_dirs: list[ScanNode] | None = None,
 ) -> list[DisplayRow]:
+    """Summary rows followed by the largest *overview_top* directories.
+
+    *top_dirs* may pass in an already computed ``top_nodes`` result (at
+    least *overview_top* long) to avoid another full-tree walk.
+    """
     temp_sz, temp_du = _category_bytes(by_category, InsightCategory.TEMP)
     cache_sz, cache_du = _category_bytes(by_category, InsightCategory.CACHE)
     build_sz, build_du = _category_bytes(by_category, InsightCategory.BUILD_ARTIFACT)
@@ -57,11 +63,13 @@ def overview_rows(
         DisplayRow(path="", name=f"─────── Largest {overview_top} directories ───────", size_bytes=0),
     ]
 
-    for node in top_nodes(root, overview_top, NodeKind.DIRECTORY):
+    if top_dirs is None:
+        top_dirs = top_nodes(root, overview_top, NodeKind.DIRECTORY)
+    for node in top_dirs[:overview_top]:
         rows.append(
             DisplayRow(
                 path=node.path,
-                name=relative_path(node.path, root_prefix),
+                name=node.path.removeprefix(root_prefix),
                 size_bytes=node.size_bytes,
                 disk_usage=node.disk_usage,
             )
@@ -69,6 +77,11 @@ def overview_rows(
     return rows
 
 
+# Indent strings per tree depth, built once instead of per browse row.
+_MAX_CACHED_INDENT = 64
+_INDENTS: tuple[str, ...] = tuple("  " * depth for depth in range(_MAX_CACHED_INDENT))
+
+
 def browse_rows(
     browse_root: ScanNode,
     expanded: set[str],
@@ -77,11 +90,13 @@ def browse_rows(
     stack: list[tuple[ScanNode, int]] = [(browse_root, 0)]
     while stack:
         node, depth = stack.pop()
+        indent = _INDENTS[depth] if depth < _MAX_CACHED_INDENT else "  " * depth
+        is_open = False
         if node.kind is NodeKind.DIRECTORY:
-            marker = "▼" if node.path in expanded else "▶"
-            label = f"{'  ' * depth}{marker} {node.name}"
+            is_open = node.path in expanded
+            label = f"{indent}{'▼' if is_open else '▶'} {node.name}"
         else:
-            label = f"{'  ' * depth}  {node.name}"
+            label = f"{indent}  {node.name}"
         rows.append(
             DisplayRow(
                 path=node.path,
@@ -90,15 +105,14 @@ def browse_rows(
                 disk_usage=node.disk_usage,
             )
         )
-        if node.kind is NodeKind.DIRECTORY and node.path in expanded:
-            for child in reversed(node.children):
-                stack.append((child, depth + 1))
+        if is_open:
+            child_depth = depth + 1
+            stack.extend([(child, child_depth) for child in reversed(node.children)])
     return rows
 
 
 def insight_rows(
     insights: list[Insight],
-    node_by_path: dict[str, ScanNode],
     root_prefix: str,
     predicate: Callable[[Insight], bool],
 ) -> list[DisplayRow]:
@@ -106,12 +120,11 @@ def insight_rows(
     for item in insights:
         if not predicate(item):
             continue
-        node = node_by_path.get(item.path)
-        type_label = "Dir" if node is not None and node.is_dir else "File"
+        type_label = "Dir" if item.kind is NodeKind.DIRECTORY else "File"
         rows.append(
             DisplayRow(
                 path=item.path,
-                name=relative_path(item.path, root_prefix),
+                name=item.path.removeprefix(root_prefix),
                 size_bytes=item.size_bytes,
                 category=item.category.label,
                 type_label=type_label,
@@ -122,17 +135,15 @@ def insight_rows(
 
 
 def top_nodes_rows(
-    root: ScanNode,
-    limit: int,
-    kind: NodeKind,
+    nodes: list[ScanNode],
     root_prefix: str,
 ) -> list[DisplayRow]:
     rows: list[DisplayRow] = []
-    for node in top_nodes(root, limit, kind):
+    for node in nodes:
         rows.append(
             DisplayRow(
                 path=node.path,
-                name=relative_path(node.path, root_prefix),
+                name=node.path.removeprefix(root_prefix),
                 size_bytes=node.size_bytes,
                 disk_usage=node.disk_usage,
             )
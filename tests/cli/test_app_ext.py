@@ -4,7 +4,7 @@ import time
 
 from rich.panel import Panel
 
-from dux.cli.app import _ScanProgress, _render_scan_panel, _truncate_path
+from dux.cli.app import _ScanPanel, _ScanProgress, _truncate_path
 
 
 class TestTruncatePath:
@@ -35,5 +35,18 @@ class TestRenderScanPanel:
             directories=10,
             start_time=time.perf_counter() - 1.0,
         )
-        result = _render_scan_panel(progress, workers=4, phase="Scanning...")
+        result = _ScanPanel(workers=4).update(progress, phase="Scanning...")
         assert isinstance(result, Panel)
+
+    def test_update_builds_new_lines(self) -> None:
+        """Live renders from another thread, so earlier panels stay untouched."""
+        panel = _ScanPanel(workers=4)
+        first = panel.update(_ScanProgress("/a", 1, 1, time.perf_counter()), phase="Scanning...")
+        second = panel.update(_ScanProgress("/b/c", 1234, 56, time.perf_counter()), phase="Finalizing...")
+        assert first is not second
+        spinner, first_path, _ = first.renderable.renderables
+        _, second_path, second_stats = second.renderable.renderables
+        assert second.renderable.renderables[0] is spinner
+        assert first_path.plain == "Path: /a"
+        assert second_path.plain == "Path: /b/c"
+        assert "56 dirs, 1,234 files" in second_stats.plain
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass
-from pathlib import PurePosixPath
 
 from dux.services.fs import DirEntry, StatResult
 
 
-@dataclass
+@dataclass(slots=True)
 class _MockEntry:
     is_dir: bool
     size: int
@@ -17,9 +17,13 @@ class _MockEntry:
 class MemoryFileSystem:
     def __init__(self) -> None:
         self._entries: dict[str, _MockEntry] = {}
+        # parent path -> child names, in first-added order (dict as ordered set)
+        self._children: dict[str, dict[str, None]] = {}
 
     def add_dir(self, path: str) -> MemoryFileSystem:
-        self._entries[self._normalize(path)] = _MockEntry(is_dir=True, size=0, content="")
+        key = self._normalize(path)
+        self._entries[key] = _MockEntry(is_dir=True, size=0, content="")
+        self._link(key)
         return self
 
     def add_file(
@@ -30,19 +34,36 @@ class MemoryFileSystem:
         disk_usage: int | None = None,
     ) -> MemoryFileSystem:
         key = self._normalize(path)
-        # auto-create parent dirs
-        for parent in reversed(PurePosixPath(key).parents):
-            pk = str(parent)
-            if pk not in self._entries:
-                self._entries[pk] = _MockEntry(is_dir=True, size=0, content="")
+        # auto-create parent dirs, outermost first
+        end = key.find("/", 1)
+        while end != -1:
+            parent = key[:end]
+            if parent not in self._entries:
+                self._entries[parent] = _MockEntry(is_dir=True, size=0, content="")
+            end = key.find("/", end + 1)
         self._entries[key] = _MockEntry(
             is_dir=False,
             size=size,
             content=content,
             disk_usage=disk_usage if disk_usage is not None else size,
         )
+        self._link(key)
         return self
 
+    def _link(self, key: str) -> None:
+        """Record *key* under each of its ancestors, stopping at a known link."""
+        while True:
+            parent, _, name = key.rpartition("/")
+            if not name:
+                return
+            siblings = self._children.setdefault(parent, {})
+            if name in siblings:
+                return
+            siblings[name] = None
+            if not parent:
+                return
+            key = parent
+
     def expanduser(self, path: str) -> str:
         return path.replace("~", "/mock/home")
 
@@ -66,38 +87,30 @@ class MemoryFileSystem:
             raise OSError(f"No such file or directory: '{key}'")
         return entry.content
 
-    def scandir(self, path: str) -> list[DirEntry]:
+    def scandir(self, path: str) -> Iterator[DirEntry]:
         key = self._normalize(path)
         entry = self._entries.get(key)
         if entry is None:
             raise OSError(f"No such file or directory: '{key}'")
-        prefix = key.rstrip("/") + "/"
-        result: list[DirEntry] = []
-        seen: set[str] = set()
-        for p, mock in self._entries.items():
-            if not p.startswith(prefix):
-                continue
-            remainder = p[len(prefix) :]
-            if "/" in remainder:
-                child_name = remainder.split("/", 1)[0]
-                child_path = prefix + child_name
-            else:
-                child_name = remainder
-                child_path = prefix + remainder
-            if child_path not in seen:
-                seen.add(child_path)
-                child_entry = self._entries.get(child_path)
-                st = (
-                    StatResult(
-                        size=child_entry.size,
-                        is_dir=child_entry.is_dir,
-                        disk_usage=child_entry.disk_usage,
-                    )
-                    if child_entry is not None
-                    else None
+        # Missing directories raise here, at call time; entries are then
+        # produced lazily, like OsFileSystem.scandir.
+        return self._iter_children(key)
+
+    def _iter_children(self, key: str) -> Iterator[DirEntry]:
+        prefix = key + "/"
+        for child_name in self._children.get(key, ()):
+            child_path = prefix + child_name
+            child_entry = self._entries.get(child_path)
+            st = (
+                StatResult(
+                    size=child_entry.size,
+                    is_dir=child_entry.is_dir,
+                    disk_usage=child_entry.disk_usage,
                 )
-                result.append(DirEntry(path=child_path, name=child_name, stat=st))
-        return result
+                if child_entry is not None
+                else None
+            )
+            yield DirEntry(path=child_path, name=child_name, stat=st)
 
     @staticmethod
     def _normalize(path: str) -> str:
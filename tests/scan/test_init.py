@@ -9,6 +9,14 @@ from dux.scan._base import ThreadedScannerBase
 
 
 class TestDefaultScanner:
+    def test_missing_walker_falls_back_to_python(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from dux.scan.python_scanner import PythonScanner
+
+        # A None entry makes ``from dux import _walker`` raise ImportError.
+        monkeypatch.setitem(sys.modules, "dux._walker", None)
+        monkeypatch.delattr("dux._walker", raising=False)
+        assert isinstance(default_scanner(), PythonScanner)
+
     def test_darwin_returns_native_scanner(self) -> None:
         if sys.platform != "darwin":
             pytest.skip("macOS only")
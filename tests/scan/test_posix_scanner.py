@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-import os
 import sys
-import tempfile
+from pathlib import Path
 
 import pytest
 from result import Ok
@@ -23,67 +22,75 @@ def _macos_scanner(workers: int = 4) -> NativeScanner:
     return NativeScanner(scan_dir_bulk_nodes, workers=workers)
 
 
-def test_posix_scanner_basic() -> None:
-    with tempfile.TemporaryDirectory() as tmpdir:
-        os.makedirs(os.path.join(tmpdir, "sub"))
-        with open(os.path.join(tmpdir, "a.txt"), "wb") as f:
-            f.write(b"x" * 100)
-        with open(os.path.join(tmpdir, "sub", "b.txt"), "wb") as f:
-            f.write(b"y" * 200)
+# The scanners only read these trees, so each is built once per module and
+# shared by the Linux and macOS variants of a test.
+@pytest.fixture(scope="module")
+def basic_tree(tmp_path_factory: pytest.TempPathFactory) -> str:
+    root = tmp_path_factory.mktemp("basic")
+    (root / "sub").mkdir()
+    (root / "a.txt").write_bytes(b"x" * 100)
+    (root / "sub" / "b.txt").write_bytes(b"y" * 200)
+    return str(root)
 
-        result = _posix_scanner().scan(tmpdir, ScanOptions())
 
-        assert isinstance(result, Ok)
-        snapshot = result.unwrap()
-        assert snapshot.stats.files == 2
-        assert snapshot.stats.directories >= 2
-        assert snapshot.root.size_bytes == 300
-        assert snapshot.root.path == tmpdir
+@pytest.fixture(scope="module")
+def deep_tree(tmp_path_factory: pytest.TempPathFactory) -> str:
+    root = tmp_path_factory.mktemp("deep")
+    (root / "lvl1" / "lvl2").mkdir(parents=True)
+    (root / "lvl1" / "lvl2" / "deep.txt").write_bytes(b"z" * 50)
+    return str(root)
 
 
-def test_posix_scanner_max_depth() -> None:
-    with tempfile.TemporaryDirectory() as tmpdir:
-        os.makedirs(os.path.join(tmpdir, "lvl1", "lvl2"))
-        with open(os.path.join(tmpdir, "lvl1", "lvl2", "deep.txt"), "wb") as f:
-            f.write(b"z" * 50)
+def test_posix_scanner_basic(basic_tree: str) -> None:
+    result = _posix_scanner().scan(basic_tree, ScanOptions())
 
-        result = _posix_scanner().scan(tmpdir, ScanOptions(max_depth=0))
+    assert isinstance(result, Ok)
+    snapshot = result.unwrap()
+    assert snapshot.stats.files == 2
+    assert snapshot.stats.directories >= 2
+    assert snapshot.root.size_bytes == 300
+    assert snapshot.root.path == basic_tree
 
-        assert isinstance(result, Ok)
-        snapshot = result.unwrap()
-        lvl1 = next(c for c in snapshot.root.children if c.name == "lvl1")
-        assert lvl1.children == []
 
+def test_posix_scanner_shares_repeated_names(tmp_path: Path) -> None:
+    for sub in ("a", "b"):
+        (tmp_path / sub).mkdir()
+        (tmp_path / sub / "index.js").write_bytes(b"x")
 
-@pytest.mark.skipif(sys.platform != "darwin", reason="macOS only")
-def test_macos_scanner_basic() -> None:
-    with tempfile.TemporaryDirectory() as tmpdir:
-        os.makedirs(os.path.join(tmpdir, "sub"))
-        with open(os.path.join(tmpdir, "a.txt"), "wb") as f:
-            f.write(b"x" * 100)
-        with open(os.path.join(tmpdir, "sub", "b.txt"), "wb") as f:
-            f.write(b"y" * 200)
+    result = _posix_scanner().scan(str(tmp_path), ScanOptions())
+
+    assert isinstance(result, Ok)
+    first, second = (d.children[0] for d in result.unwrap().root.children)
+    assert first.name == "index.js"
+    assert first.name is second.name
+
+
+def test_posix_scanner_max_depth(deep_tree: str) -> None:
+    result = _posix_scanner().scan(deep_tree, ScanOptions(max_depth=0))
 
-        result = _macos_scanner().scan(tmpdir, ScanOptions())
+    assert isinstance(result, Ok)
+    snapshot = result.unwrap()
+    lvl1 = next(c for c in snapshot.root.children if c.name == "lvl1")
+    assert lvl1.children == []
 
-        assert isinstance(result, Ok)
-        snapshot = result.unwrap()
-        assert snapshot.stats.files == 2
-        assert snapshot.stats.directories >= 2
-        assert snapshot.root.size_bytes == 300
-        assert snapshot.root.path == tmpdir
+
+@pytest.mark.skipif(sys.platform != "darwin", reason="macOS only")
+def test_macos_scanner_basic(basic_tree: str) -> None:
+    result = _macos_scanner().scan(basic_tree, ScanOptions())
+
+    assert isinstance(result, Ok)
+    snapshot = result.unwrap()
+    assert snapshot.stats.files == 2
+    assert snapshot.stats.directories >= 2
+    assert snapshot.root.size_bytes == 300
+    assert snapshot.root.path == basic_tree
 
 
 @pytest.mark.skipif(sys.platform != "darwin", reason="macOS only")
-def test_macos_scanner_max_depth() -> None:
-    with tempfile.TemporaryDirectory() as tmpdir:
-        os.makedirs(os.path.join(tmpdir, "lvl1", "lvl2"))
-        with open(os.path.join(tmpdir, "lvl1", "lvl2", "deep.txt"), "wb") as f:
-            f.write(b"z" * 50)
-
-        result = _macos_scanner().scan(tmpdir, ScanOptions(max_depth=0))
-
-        assert isinstance(result, Ok)
-        snapshot = result.unwrap()
-        lvl1 = next(c for c in snapshot.root.children if c.name == "lvl1")
-        assert lvl1.children == []
+def test_macos_scanner_max_depth(deep_tree: str) -> None:
+    result = _macos_scanner().scan(deep_tree, ScanOptions(max_depth=0))
+
+    assert isinstance(result, Ok)
+    snapshot = result.unwrap()
+    lvl1 = next(c for c in snapshot.root.children if c.name == "lvl1")
+    assert lvl1.children == []
@@ -26,6 +26,26 @@ def test_scanner_returns_valid_results() -> None:
     assert snapshot.root.size_bytes == 224
 
 
+def test_repeated_basenames_share_one_str() -> None:
+    fs = (
+        MemoryFileSystem()
+        .add_dir("/root")
+        .add_dir("/root/a")
+        .add_file("/root/a/index.js", size=1)
+        .add_dir("/root/b")
+        .add_file("/root/b/index.js", size=2)
+    )
+
+    result = PythonScanner(workers=1, fs=fs).scan("/root", ScanOptions())
+    assert isinstance(result, Ok)
+    root = result.unwrap().root
+
+    (first,) = root.children[0].children
+    (second,) = root.children[1].children
+    assert first.name == "index.js"
+    assert first.name is second.name
+
+
 def test_missing_path_returns_error() -> None:
     fs = MemoryFileSystem()
 
@@ -79,7 +99,7 @@ def test_access_error_counted() -> None:
     original_scandir = fs.scandir
 
     def patched_scandir(path: str) -> list[DirEntry]:
-        entries = original_scandir(path)
+        entries = list(original_scandir(path))
         if path == "/root":
             entries.append(DirEntry(path="/root/broken", name="broken", stat=None))
         return entries
@@ -185,3 +185,60 @@ def test_repeated_pattern_in_text() -> None:
     result = ac.iter("aaa")
     # "aa" at positions 0-1 (end=1) and 1-2 (end=2)
     assert result == [(1, 1), (2, 1)]
+
+
+def test_end_only_word_reported_only_at_end() -> None:
+    ac = AhoCorasick()
+    ac.add_word(".log", "log", True)
+    ac.make_automaton()
+    assert ac.iter("a.log") == [(4, "log")]
+    assert ac.iter("a.log.gz") == []
+
+
+def test_match_returns_values_only() -> None:
+    ac = AhoCorasick()
+    ac.add_word("/tmp/", "anywhere")
+    ac.add_word("/tmp", "end", True)
+    ac.make_automaton()
+    assert ac.match("/a/tmp/b") == ["anywhere"]
+    assert ac.match("/a/tmp") == ["end"]
+    assert ac.match("/a/b") == []
+
+
+def test_match_end_only_uses_byte_length() -> None:
+    """end_only is checked against UTF-8 bytes, so non-ASCII text still matches."""
+    ac = AhoCorasick()
+    ac.add_word(".log", "log", True)
+    ac.make_automaton()
+    assert ac.match("/home/ü/a.log") == ["log"]
+
+
+def test_match_before_make_automaton_raises() -> None:
+    ac = AhoCorasick()
+    ac.add_word("x", 1)
+    with pytest.raises(RuntimeError, match="call make_automaton"):
+        ac.match("x")
+
+
+def test_match_rejects_non_str() -> None:
+    ac = AhoCorasick()
+    ac.add_word("x", 1)
+    ac.make_automaton()
+    with pytest.raises(TypeError, match="must be str, not bytes"):
+        ac.match(b"x")  # type: ignore[arg-type]
+
+
+def test_mismatch_resumes_from_longest_suffix_state() -> None:
+    """After a mismatch the scan continues from the fail state, not the root.
+
+    In "abcabd" the "abc" branch dies at index 5; "ab" ending at index 4 must
+    carry over so "abd" is still found, and "bd" is reported via the same
+    transition.
+    """
+    ac = AhoCorasick()
+    ac.add_word("abce", 1)
+    ac.add_word("abd", 2)
+    ac.add_word("bd", 3)
+    ac.make_automaton()
+    assert sorted(ac.iter("abcabd")) == [(5, 2), (5, 3)]
+    assert ac.iter("abcabce") == [(6, 1)]
@@ -85,3 +85,11 @@ def test_case_insensitive_directory_matching() -> None:
     bundle = generate_insights(_tree_with(node), config)
 
     assert any(item.category is InsightCategory.BUILD_ARTIFACT for item in bundle.insights)
+
+
+def test_category_stats_track_path_hashes() -> None:
+    config = default_config()
+    node = make_file("/root/tmp/trace.log", du=2 * 1024 * 1024)
+    bundle = generate_insights(_tree_with(node), config)
+
+    assert hash("/root/tmp/trace.log") in bundle.by_category[InsightCategory.TEMP].path_hashes
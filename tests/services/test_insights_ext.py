@@ -3,7 +3,7 @@ from __future__ import annotations
 from dux.config.schema import AppConfig, PatternRule
 from dux.models.enums import InsightCategory
 from dux.models.insight import Insight, InsightBundle
-from dux.services.insights import _heap_push, filter_insights, generate_insights
+from dux.services.insights import _select_top, filter_insights, generate_insights
 from tests.factories import make_dir, make_file
 
 
@@ -11,47 +11,21 @@ def _insight(path: str, du: int) -> Insight:
     return Insight(path=path, size_bytes=du, category=InsightCategory.TEMP, summary="test", disk_usage=du)
 
 
-class TestHeapPush:
-    def test_dedup_lower_usage_skipped(self) -> None:
-        heap: list[tuple[int, str, Insight]] = []
-        seen: dict[str, int] = {}
-        i1 = _insight("/a", 100)
-        i2 = _insight("/a", 50)
-        _heap_push(heap, seen, i1, 10)
-        _heap_push(heap, seen, i2, 10)
-        assert seen["/a"] == 100
-        assert len(heap) == 1
+class TestSelectTop:
+    def test_keeps_largest_in_descending_order(self) -> None:
+        entries = [_insight("/a", 10), _insight("/b", 30), _insight("/c", 20)]
+        top = _select_top(entries, 2)
+        assert [e.path for e in top] == ["/b", "/c"]
 
-    def test_dedup_higher_usage_replaces(self) -> None:
-        heap: list[tuple[int, str, Insight]] = []
-        seen: dict[str, int] = {}
-        i1 = _insight("/a", 50)
-        i2 = _insight("/a", 100)
-        _heap_push(heap, seen, i1, 10)
-        _heap_push(heap, seen, i2, 10)
-        assert seen["/a"] == 100
-        assert len(heap) == 2
+    def test_fewer_entries_than_max_size(self) -> None:
+        entries = [_insight("/a", 5)]
+        assert [e.path for e in _select_top(entries, 10)] == ["/a"]
 
-    def test_replace_on_full_heap(self) -> None:
-        heap: list[tuple[int, str, Insight]] = []
-        seen: dict[str, int] = {}
-        _heap_push(heap, seen, _insight("/a", 10), 2)
-        _heap_push(heap, seen, _insight("/b", 20), 2)
-        assert len(heap) == 2
-        _heap_push(heap, seen, _insight("/c", 30), 2)
-        assert len(heap) == 2
-        paths = {e[1] for e in heap}
-        assert "/c" in paths
-
-    def test_skip_when_too_small_for_full_heap(self) -> None:
-        heap: list[tuple[int, str, Insight]] = []
-        seen: dict[str, int] = {}
-        _heap_push(heap, seen, _insight("/a", 100), 2)
-        _heap_push(heap, seen, _insight("/b", 200), 2)
-        _heap_push(heap, seen, _insight("/c", 5), 2)
-        assert len(heap) == 2
-        paths_in_heap = {e[1] for e in heap}
-        assert "/c" not in paths_in_heap
+    def test_ties_do_not_compare_insights(self) -> None:
+        # Equal usage: only the key is compared, never Insight (which
+        # defines no ordering).
+        entries = [_insight("/a", 10), _insight("/b", 10)]
+        assert len(_select_top(entries, 2)) == 2
 
 
 class TestGenerateInsights:
@@ -84,6 +58,17 @@ class TestGenerateInsights:
         assert "/r/node_modules" in matched_paths
         assert "/r/node_modules/pkg" not in matched_paths
 
+    def test_top_k_survives_batch_pruning(self) -> None:
+        files = [make_file(f"/r/f{i}.log", du=i) for i in range(1, 51)]
+        root = make_dir("/r", du=sum(range(1, 51)), children=files)
+        config = AppConfig(
+            patterns=[PatternRule("log", "**/*.log", InsightCategory.TEMP)],
+            max_insights_per_category=10,
+        )
+        bundle = generate_insights(root, config)
+        assert [i.disk_usage for i in bundle.insights] == list(range(50, 40, -1))
+        assert bundle.by_category[InsightCategory.TEMP].count == 50
+
 
 class TestFilterInsights:
     def test_basic_filter(self) -> None:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import pytest
 
+from dux.config.defaults import default_config
 from dux.config.schema import PatternRule
 from dux.models.enums import ApplyTo, InsightCategory
 from dux.services.patterns import (
@@ -34,69 +35,37 @@ def test_expand_braces_finds_first_close_brace() -> None:
     result = _expand_braces("**/*.{a,{b,c}}")
     # first { at 4, first } at 10 → choices = ["a", "{b", "c"], suffix = "}"
     # → "**/*.a}", "**/*.{b}", "**/*.c}"
-    # recursive call on "**/*.{b}" → "**/*.b"
+    # next round expands "**/*.{b}" → "**/*.b"
     assert set(result) == {"**/*.a}", "**/*.b", "**/*.c}"}
 
 
-# ── _classify ───────────────────────────────────────────────────────
-
-
-def test_classify_contains() -> None:
-    m = _classify("**/segment/**")
-    assert m.kind == _CONTAINS
-    assert m.value == "/segment/"
-    assert m.alt == "/segment"
-
-
-def test_classify_contains_multi_segment() -> None:
-    m = _classify("**/path/to/thing/**")
-    assert m.kind == _CONTAINS
-    assert m.value == "/path/to/thing/"
-    assert m.alt == "/path/to/thing"
-
-
-def test_classify_endswith() -> None:
-    m = _classify("**/*.ext")
-    assert m.kind == _ENDSWITH
-    assert m.value == ".ext"
-    assert m.alt == ""
-
-
-def test_classify_startswith() -> None:
-    m = _classify("**/prefix*")
-    assert m.kind == _STARTSWITH
-    assert m.value == "prefix"
-    assert m.alt == ""
-
-
-def test_classify_exact() -> None:
-    m = _classify("**/exactname")
-    assert m.kind == _EXACT
-    assert m.value == "exactname"
-    assert m.alt == ""
+def test_expand_braces_multiple_groups_in_order() -> None:
+    assert _expand_braces("{x,y}/*.{a,b}") == ("x/*.a", "x/*.b", "y/*.a", "y/*.b")
 
 
-def test_classify_no_doublestar_prefix_is_glob() -> None:
-    m = _classify("src/*.py")
-    assert m.kind == _GLOB
-    assert m.value == "src/*.py"
-
-
-def test_classify_glob_chars_in_contains_fallback() -> None:
-    m = _classify("**/foo*bar/**")
-    assert m.kind == _GLOB
-
-
-def test_classify_lowercases_values() -> None:
-    m = _classify("**/FooBar/**")
-    assert m.value == "/foobar/"
-    assert m.alt == "/foobar"
+# ── _classify ───────────────────────────────────────────────────────
 
-    m2 = _classify("**/*.LOG")
-    assert m2.value == ".log"
 
-    m3 = _classify("**/README")
-    assert m3.value == "readme"
+@pytest.mark.parametrize(
+    ("pattern", "kind", "value", "alt"),
+    [
+        pytest.param("**/segment/**", _CONTAINS, "/segment/", "/segment", id="contains"),
+        pytest.param(
+            "**/path/to/thing/**", _CONTAINS, "/path/to/thing/", "/path/to/thing", id="contains_multi_segment"
+        ),
+        pytest.param("**/*.ext", _ENDSWITH, ".ext", "", id="endswith"),
+        pytest.param("**/prefix*", _STARTSWITH, "prefix", "", id="startswith"),
+        pytest.param("**/exactname", _EXACT, "exactname", "", id="exact"),
+        pytest.param("src/*.py", _GLOB, "src/*.py", "", id="no_doublestar_prefix_is_glob"),
+        pytest.param("**/foo*bar/**", _GLOB, "**/foo*bar/**", "", id="glob_chars_in_contains_fallback"),
+        pytest.param("**/FooBar/**", _CONTAINS, "/foobar/", "/foobar", id="lowercases_contains"),
+        pytest.param("**/*.LOG", _ENDSWITH, ".log", "", id="lowercases_endswith"),
+        pytest.param("**/README", _EXACT, "readme", "", id="lowercases_exact"),
+    ],
+)
+def test_classify(pattern: str, kind: int, value: str, alt: str) -> None:
+    m = _classify(pattern)
+    assert (m.kind, m.value, m.alt) == (kind, value, alt)
 
 
 # ── compile_ruleset / match_all pipeline ────────────────────────────
@@ -114,24 +83,35 @@ def _rule(
     return PatternRule(name=name, pattern=pattern, category=category, apply_to=_APPLY_TO_STR[apply_to])
 
 
-def test_apply_to_file_does_not_match_dirs() -> None:
-    rs = compile_ruleset([_rule("r", "**/*.log", apply_to="file")])
-    result = match_all(rs, "/a/b/foo.log", "foo.log", is_dir=True)
-    assert result == []
+def _names(rs: CompiledRuleSet, path: str, is_dir: bool) -> list[str]:
+    """Names of the rules matching *path*, whose last segment is the basename."""
+    return [r.name for r in match_all(rs, path, path.rsplit("/", 1)[1], is_dir=is_dir)]
 
 
-def test_apply_to_dir_does_not_match_files() -> None:
-    rs = compile_ruleset([_rule("r", "**/*.egg-info", apply_to="dir")])
-    result = match_all(rs, "/a/foo.egg-info", "foo.egg-info", is_dir=False)
-    assert result == []
+@pytest.fixture(scope="module")
+def apply_to_ruleset() -> CompiledRuleSet:
+    return compile_ruleset(
+        [
+            _rule("f", "**/*.log", InsightCategory.TEMP, apply_to="file"),
+            _rule("d", "**/*.egg-info", InsightCategory.CACHE, apply_to="dir"),
+            _rule("b", "**/node_modules/**", InsightCategory.BUILD_ARTIFACT),
+        ]
+    )
 
 
-def test_apply_to_both_matches_files_and_dirs() -> None:
-    rs = compile_ruleset([_rule("r", "**/node_modules/**")])
-    hit_file = match_all(rs, "/x/node_modules/y", "y", is_dir=False)
-    hit_dir = match_all(rs, "/x/node_modules/y", "y", is_dir=True)
-    assert len(hit_file) == 1
-    assert len(hit_dir) == 1
+@pytest.mark.parametrize(
+    ("path", "is_dir", "expected"),
+    [
+        pytest.param("/a/b/foo.log", False, ["f"], id="file_rule_on_file"),
+        pytest.param("/a/b/foo.log", True, [], id="file_rule_on_dir"),
+        pytest.param("/a/foo.egg-info", True, ["d"], id="dir_rule_on_dir"),
+        pytest.param("/a/foo.egg-info", False, [], id="dir_rule_on_file"),
+        pytest.param("/x/node_modules/y", False, ["b"], id="both_rule_on_file"),
+        pytest.param("/x/node_modules/y", True, ["b"], id="both_rule_on_dir"),
+    ],
+)
+def test_apply_to(apply_to_ruleset: CompiledRuleSet, path: str, is_dir: bool, expected: list[str]) -> None:
+    assert sorted(_names(apply_to_ruleset, path, is_dir)) == expected
 
 
 def test_first_match_wins_dedup_by_category() -> None:
@@ -196,57 +176,45 @@ def test_endswith_match() -> None:
 # ── ENDSWITH via Aho-Corasick ────────────────────────────────────────
 
 
-class TestEndswithAC:
-    """ENDSWITH patterns go through the Aho-Corasick automaton as end-only keys."""
+@pytest.fixture(scope="module")
+def endswith_ruleset() -> CompiledRuleSet:
+    # One automaton holding every suffix TestEndswithAC.test_suffix exercises.
+    # Rule categories differ so no case depends on per-category dedup.
+    return compile_ruleset(
+        [
+            _rule("log", "**/*.log", InsightCategory.TEMP, apply_to="file"),
+            _rule("swap", "**/*.{swp,swo,bak}", InsightCategory.CACHE),
+            _rule("egg", "**/*.egg-info", InsightCategory.BUILD_ARTIFACT, apply_to="dir"),
+        ]
+    )
 
-    def test_suffix_does_not_match_mid_path(self) -> None:
-        rs = compile_ruleset([_rule("r", "**/*.log", apply_to="file")])
-        result = match_all(rs, "/a/foo.log/bar", "bar", is_dir=False)
-        assert result == []
 
-    def test_suffix_matches_at_end_of_path(self) -> None:
-        rs = compile_ruleset([_rule("r", "**/*.log")])
-        result = match_all(rs, "/a/b/error.log", "error.log", is_dir=False)
-        assert len(result) == 1
-        assert result[0].name == "r"
+class TestEndswithAC:
+    """ENDSWITH patterns go through the Aho-Corasick automaton as end-only keys."""
 
-    def test_multiple_endswith_suffixes(self) -> None:
-        rs = compile_ruleset(
-            [
-                _rule("log", "**/*.log", apply_to="file"),
-                _rule("bak", "**/*.bak", apply_to="file"),
-            ]
-        )
-        log_hit = match_all(rs, "/a/x.log", "x.log", is_dir=False)
-        bak_hit = match_all(rs, "/a/x.bak", "x.bak", is_dir=False)
-        txt_miss = match_all(rs, "/a/x.txt", "x.txt", is_dir=False)
-        assert len(log_hit) == 1 and log_hit[0].name == "log"
-        assert len(bak_hit) == 1 and bak_hit[0].name == "bak"
-        assert txt_miss == []
-
-    def test_endswith_apply_to_dir(self) -> None:
-        rs = compile_ruleset([_rule("r", "**/*.egg-info", apply_to="dir")])
-        dir_hit = match_all(rs, "/a/foo.egg-info", "foo.egg-info", is_dir=True)
-        file_miss = match_all(rs, "/a/foo.egg-info", "foo.egg-info", is_dir=False)
-        assert len(dir_hit) == 1
-        assert file_miss == []
+    @pytest.mark.parametrize(
+        ("path", "is_dir", "expected"),
+        [
+            pytest.param("/a/b/error.log", False, ["log"], id="suffix_at_end_of_path"),
+            pytest.param("/a/foo.log/bar", False, [], id="suffix_mid_path"),
+            pytest.param("/a/x.logx", False, [], id="partial_suffix"),
+            pytest.param("/a/x.log", True, [], id="file_only_suffix_on_dir"),
+            pytest.param("/a/f.swp", False, ["swap"], id="brace_swp"),
+            pytest.param("/a/f.swo", False, ["swap"], id="brace_swo"),
+            pytest.param("/a/f.bak", False, ["swap"], id="brace_bak"),
+            pytest.param("/a/f.txt", False, [], id="unlisted_suffix"),
+            pytest.param("/a/foo.egg-info", True, ["egg"], id="dir_only_suffix_on_dir"),
+            pytest.param("/a/foo.egg-info", False, [], id="dir_only_suffix_on_file"),
+        ],
+    )
+    def test_suffix(self, endswith_ruleset: CompiledRuleSet, path: str, is_dir: bool, expected: list[str]) -> None:
+        assert sorted(_names(endswith_ruleset, path, is_dir)) == expected
 
     def test_endswith_case_insensitive(self) -> None:
         rs = compile_ruleset([_rule("r", "**/*.LOG")])
         result = match_all(rs, "/a/b/error.log", "error.log", is_dir=False)
         assert len(result) == 1
 
-    def test_endswith_brace_expansion(self) -> None:
-        rs = compile_ruleset([_rule("r", "**/*.{swp,swo,bak}")])
-        swp = match_all(rs, "/a/f.swp", "f.swp", is_dir=False)
-        swo = match_all(rs, "/a/f.swo", "f.swo", is_dir=False)
-        bak = match_all(rs, "/a/f.bak", "f.bak", is_dir=False)
-        py = match_all(rs, "/a/f.py", "f.py", is_dir=False)
-        assert len(swp) == 1
-        assert len(swo) == 1
-        assert len(bak) == 1
-        assert py == []
-
     def test_endswith_dedup_by_category(self) -> None:
         rs = compile_ruleset(
             [
@@ -281,41 +249,42 @@ class TestEndswithAC:
         assert "tmp" in names
         assert "log" in names
 
-    def test_endswith_partial_suffix_no_match(self) -> None:
-        rs = compile_ruleset([_rule("r", "**/*.log")])
-        result = match_all(rs, "/a/x.logx", "x.logx", is_dir=False)
-        assert result == []
-
-    def test_endswith_populates_ac(self) -> None:
-        rs = compile_ruleset([_rule("r", "**/*.log", apply_to="file")])
-        assert rs.for_file.ac is not None
+    def test_endswith_populates_ac(self, endswith_ruleset: CompiledRuleSet) -> None:
+        assert endswith_ruleset.for_file.ac is not None
+        assert endswith_ruleset.for_dir.ac is not None
 
 
 # ── CONTAINS via Aho-Corasick ────────────────────────────────────────
 
 
-class TestContainsAC:
-    """CONTAINS patterns go through the Aho-Corasick automaton."""
+@pytest.fixture(scope="module")
+def contains_ruleset() -> CompiledRuleSet:
+    # One automaton holding every segment TestContainsAC.test_contains exercises.
+    return compile_ruleset(
+        [
+            _rule("tmp", "**/tmp/**", InsightCategory.TEMP),
+            _rule("node_modules", "**/node_modules/**", InsightCategory.BUILD_ARTIFACT),
+            _rule("pip", "**/.cache/pip/**", InsightCategory.CACHE),
+        ]
+    )
 
-    def test_no_partial_segment_match(self) -> None:
-        rs = compile_ruleset([_rule("r", "**/tmp/**")])
-        result = match_all(rs, "/a/tmpdir/b", "b", is_dir=False)
-        assert result == []
 
-    def test_segment_at_start_of_path(self) -> None:
-        rs = compile_ruleset([_rule("r", "**/tmp/**")])
-        result = match_all(rs, "/tmp/foo", "foo", is_dir=False)
-        assert len(result) == 1
+class TestContainsAC:
+    """CONTAINS patterns go through the Aho-Corasick automaton."""
 
-    def test_deeply_nested_match(self) -> None:
-        rs = compile_ruleset([_rule("r", "**/node_modules/**")])
-        result = match_all(
-            rs,
-            "/a/b/c/node_modules/d/e/f",
-            "f",
-            is_dir=False,
-        )
-        assert len(result) == 1
+    @pytest.mark.parametrize(
+        ("path", "is_dir", "expected"),
+        [
+            pytest.param("/tmp/foo", False, ["tmp"], id="segment_at_start_of_path"),
+            pytest.param("/a/tmpdir/b", False, [], id="no_partial_segment"),
+            pytest.param("/a/tmp_old", True, [], id="alt_not_a_substring"),
+            pytest.param("/a/b/c/node_modules/d/e/f", False, ["node_modules"], id="deeply_nested"),
+            pytest.param("/a/node_modules", True, ["node_modules"], id="alt_matches_directory_itself"),
+            pytest.param("/home/user/.cache/pip/wheels/x", False, ["pip"], id="multi_segment"),
+        ],
+    )
+    def test_contains(self, contains_ruleset: CompiledRuleSet, path: str, is_dir: bool, expected: list[str]) -> None:
+        assert sorted(_names(contains_ruleset, path, is_dir)) == expected
 
     def test_multiple_contains_patterns(self) -> None:
         rs = compile_ruleset(
@@ -330,31 +299,6 @@ class TestContainsAC:
         cache_hit = match_all(rs, "/a/.cache/x", "x", is_dir=False)
         assert len(cache_hit) == 1 and cache_hit[0].name == "cache"
 
-    def test_alt_matches_directory_entry_itself(self) -> None:
-        rs = compile_ruleset([_rule("r", "**/node_modules/**")])
-        result = match_all(
-            rs,
-            "/a/node_modules",
-            "node_modules",
-            is_dir=True,
-        )
-        assert len(result) == 1
-
-    def test_alt_does_not_fire_as_substring(self) -> None:
-        rs = compile_ruleset([_rule("r", "**/tmp/**")])
-        result = match_all(rs, "/a/tmp_old", "tmp_old", is_dir=True)
-        assert result == []
-
-    def test_contains_multi_segment(self) -> None:
-        rs = compile_ruleset([_rule("r", "**/.cache/pip/**")])
-        result = match_all(
-            rs,
-            "/home/user/.cache/pip/wheels/x",
-            "x",
-            is_dir=False,
-        )
-        assert len(result) == 1
-
     def test_contains_case_insensitive(self) -> None:
         rs = compile_ruleset([_rule("r", "**/TMP/**")])
         result = match_all(rs, "/a/tmp/b", "b", is_dir=False)
@@ -416,130 +360,123 @@ def test_ac_both_populated_for_both_contains() -> None:
     assert rs.for_dir.ac is not None
 
 
-def test_additional_paths_exact_match() -> None:
+@pytest.fixture(scope="module")
+def additional_paths_ruleset() -> CompiledRuleSet:
     rule = _rule("extra", "**/*", InsightCategory.CACHE)
-    rs = compile_ruleset([], additional_paths=[("/home/user/.cache", rule)])
-    result = match_all(rs, "/home/user/.cache", ".cache", is_dir=True)
-    assert len(result) == 1
+    return compile_ruleset([], additional_paths=[("/home/user/.cache", rule)])
 
 
-def test_additional_paths_prefix_match() -> None:
-    rule = _rule("extra", "**/*", InsightCategory.CACHE)
-    rs = compile_ruleset([], additional_paths=[("/home/user/.cache", rule)])
-    result = match_all(rs, "/home/user/.cache/pip/foo", "foo", is_dir=False)
-    assert len(result) == 1
+@pytest.mark.parametrize(
+    ("path", "is_dir", "expected"),
+    [
+        pytest.param("/home/user/.cache", True, ["extra"], id="exact_match"),
+        pytest.param("/home/user/.cache/pip/foo", False, ["extra"], id="prefix_match"),
+        pytest.param("/home/user/.cachex/foo", False, [], id="no_partial_prefix"),
+    ],
+)
+def test_additional_paths(
+    additional_paths_ruleset: CompiledRuleSet, path: str, is_dir: bool, expected: list[str]
+) -> None:
+    assert sorted(_names(additional_paths_ruleset, path, is_dir)) == expected
 
 
-def test_additional_paths_no_partial_prefix() -> None:
-    rule = _rule("extra", "**/*", InsightCategory.CACHE)
-    rs = compile_ruleset([], additional_paths=[("/home/user/.cache", rule)])
-    result = match_all(rs, "/home/user/.cachex/foo", "foo", is_dir=False)
-    assert result == []
+def test_additional_paths_first_base_per_category_wins() -> None:
+    outer = _rule("outer", "**/*", InsightCategory.CACHE)
+    inner = _rule("inner", "**/*", InsightCategory.CACHE)
+    temp = _rule("temp", "**/*", InsightCategory.TEMP)
+    rs = compile_ruleset(
+        [],
+        additional_paths=[("/h/.cache", outer), ("/h/.cache/pip", inner), ("/h/.cache/pip", temp)],
+    )
+    assert [r.name for r in match_all(rs, "/h/.cache/pip/x", "x", is_dir=False)] == ["outer", "temp"]
+    assert [r.name for r in match_all(rs, "/h/.cache/npm", "npm", is_dir=True)] == ["outer"]
 
 
 # ── Default rules integration ───────────────────────────────────────
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def default_ruleset() -> CompiledRuleSet:
-    from dux.config.defaults import default_config
-
-    cfg = default_config()
-    return compile_ruleset(cfg.patterns)
+    # Read-only in every test below, so one compiled set serves the module.
+    return compile_ruleset(default_config().patterns)
 
 
 def _matches(rs: CompiledRuleSet, path: str, basename: str, is_dir: bool) -> list[PatternRule]:
     return match_all(rs, path.lower(), basename.lower(), is_dir)
 
 
-class TestDefaultRulesTemp:
-    def test_tmp_dir(self, default_ruleset: CompiledRuleSet) -> None:
-        result = _matches(default_ruleset, "/a/tmp/b", "b", is_dir=False)
-        assert any(r.category == InsightCategory.TEMP for r in result)
-
-    def test_log_file(self, default_ruleset: CompiledRuleSet) -> None:
-        result = _matches(default_ruleset, "/a/b/app.log", "app.log", is_dir=False)
-        assert any(r.category == InsightCategory.TEMP for r in result)
-
-    def test_ds_store(self, default_ruleset: CompiledRuleSet) -> None:
-        result = _matches(default_ruleset, "/a/.DS_Store", ".DS_Store", is_dir=False)
-        assert any(r.category == InsightCategory.TEMP for r in result)
-
-    def test_pytest_cache(self, default_ruleset: CompiledRuleSet) -> None:
-        result = _matches(default_ruleset, "/a/.pytest_cache/v/cache", "cache", is_dir=False)
-        assert any(r.category == InsightCategory.TEMP for r in result)
-
-    def test_coverage_files(self, default_ruleset: CompiledRuleSet) -> None:
-        result = _matches(default_ruleset, "/a/.coverage.abc", ".coverage.abc", is_dir=False)
-        assert any(r.category == InsightCategory.TEMP for r in result)
-
-    def test_editor_swaps(self, default_ruleset: CompiledRuleSet) -> None:
-        result = _matches(default_ruleset, "/a/file.swp", "file.swp", is_dir=False)
-        assert any(r.category == InsightCategory.TEMP for r in result)
-
-    def test_mypy_cache(self, default_ruleset: CompiledRuleSet) -> None:
-        result = _matches(default_ruleset, "/a/.mypy_cache/x", "x", is_dir=False)
-        assert any(r.category == InsightCategory.TEMP for r in result)
-
-    def test_ruff_cache(self, default_ruleset: CompiledRuleSet) -> None:
-        result = _matches(default_ruleset, "/a/.ruff_cache/x", "x", is_dir=False)
-        assert any(r.category == InsightCategory.TEMP for r in result)
-
-
-class TestDefaultRulesCache:
-    def test_npm_cache(self, default_ruleset: CompiledRuleSet) -> None:
-        result = _matches(default_ruleset, "/a/.npm/foo", "foo", is_dir=False)
-        assert any(r.category == InsightCategory.CACHE for r in result)
-
-    def test_pip_cache(self, default_ruleset: CompiledRuleSet) -> None:
-        result = _matches(default_ruleset, "/a/.cache/pip/foo", "foo", is_dir=False)
-        assert any(r.category == InsightCategory.CACHE for r in result)
-
-    def test_gradle_cache(self, default_ruleset: CompiledRuleSet) -> None:
-        result = _matches(default_ruleset, "/a/.gradle/caches/foo", "foo", is_dir=False)
-        assert any(r.category == InsightCategory.CACHE for r in result)
+_TEMP = InsightCategory.TEMP
+_CACHE = InsightCategory.CACHE
+_BUILD = InsightCategory.BUILD_ARTIFACT
+
+# (id, path, basename, is_dir, category the default rules must report)
+_DEFAULT_RULE_CASES: tuple[tuple[str, str, str, bool, InsightCategory], ...] = (
+    ("tmp_dir", "/a/tmp/b", "b", False, _TEMP),
+    ("log_file", "/a/b/app.log", "app.log", False, _TEMP),
+    ("ds_store", "/a/.DS_Store", ".DS_Store", False, _TEMP),
+    ("pytest_cache", "/a/.pytest_cache/v/cache", "cache", False, _TEMP),
+    ("coverage_files", "/a/.coverage.abc", ".coverage.abc", False, _TEMP),
+    ("editor_swaps", "/a/file.swp", "file.swp", False, _TEMP),
+    ("mypy_cache", "/a/.mypy_cache/x", "x", False, _TEMP),
+    ("ruff_cache", "/a/.ruff_cache/x", "x", False, _TEMP),
+    ("npm_cache", "/a/.npm/foo", "foo", False, _CACHE),
+    ("pip_cache", "/a/.cache/pip/foo", "foo", False, _CACHE),
+    ("gradle_cache", "/a/.gradle/caches/foo", "foo", False, _CACHE),
+    ("cargo_registry", "/a/.cargo/registry/foo", "foo", False, _CACHE),
+    ("huggingface_cache", "/a/.cache/huggingface/models/x", "x", False, _CACHE),
+    ("node_modules", "/a/node_modules/foo", "foo", False, _BUILD),
+    ("venv", "/a/.venv/lib/foo", "foo", False, _BUILD),
+    ("pycache", "/a/__pycache__/foo.pyc", "foo.pyc", False, _BUILD),
+    ("egg_info_dir", "/a/foo.egg-info", "foo.egg-info", True, _BUILD),
+    ("tox", "/a/.tox/py39/lib/foo", "foo", False, _BUILD),
+    ("rust_target", "/a/target/release/bin", "bin", False, _BUILD),
+)
 
-    def test_cargo_registry(self, default_ruleset: CompiledRuleSet) -> None:
-        result = _matches(default_ruleset, "/a/.cargo/registry/foo", "foo", is_dir=False)
-        assert any(r.category == InsightCategory.CACHE for r in result)
 
-    def test_huggingface_cache(self, default_ruleset: CompiledRuleSet) -> None:
-        result = _matches(default_ruleset, "/a/.cache/huggingface/models/x", "x", is_dir=False)
-        assert any(r.category == InsightCategory.CACHE for r in result)
+@pytest.mark.parametrize(
+    ("path", "basename", "is_dir", "category"),
+    [pytest.param(*case[1:], id=case[0]) for case in _DEFAULT_RULE_CASES],
+)
+def test_default_rule(
+    default_ruleset: CompiledRuleSet, path: str, basename: str, is_dir: bool, category: InsightCategory
+) -> None:
+    result = _matches(default_ruleset, path, basename, is_dir=is_dir)
+    assert any(r.category == category for r in result)
 
 
-class TestDefaultRulesBuildArtifact:
-    def test_node_modules(self, default_ruleset: CompiledRuleSet) -> None:
-        result = _matches(default_ruleset, "/a/node_modules/foo", "foo", is_dir=False)
-        assert any(r.category == InsightCategory.BUILD_ARTIFACT for r in result)
+def test_default_egg_info_not_file(default_ruleset: CompiledRuleSet) -> None:
+    result = _matches(default_ruleset, "/a/foo.egg-info", "foo.egg-info", is_dir=False)
+    ba_rules = [r for r in result if r.name == "Python Egg Info"]
+    assert ba_rules == []
 
-    def test_venv(self, default_ruleset: CompiledRuleSet) -> None:
-        result = _matches(default_ruleset, "/a/.venv/lib/foo", "foo", is_dir=False)
-        assert any(r.category == InsightCategory.BUILD_ARTIFACT for r in result)
 
-    def test_pycache(self, default_ruleset: CompiledRuleSet) -> None:
-        result = _matches(default_ruleset, "/a/__pycache__/foo.pyc", "foo.pyc", is_dir=False)
-        assert any(r.category == InsightCategory.BUILD_ARTIFACT for r in result)
+def test_case_insensitive_through_pipeline(default_ruleset: CompiledRuleSet) -> None:
+    path = "/A/NODE_MODULES/foo"
+    result = match_all(default_ruleset, path.lower(), "foo", is_dir=False)
+    assert any(r.category == InsightCategory.BUILD_ARTIFACT for r in result)
 
-    def test_egg_info_dir(self, default_ruleset: CompiledRuleSet) -> None:
-        result = _matches(default_ruleset, "/a/foo.egg-info", "foo.egg-info", is_dir=True)
-        assert any(r.category == InsightCategory.BUILD_ARTIFACT for r in result)
 
-    def test_egg_info_not_file(self, default_ruleset: CompiledRuleSet) -> None:
-        result = _matches(default_ruleset, "/a/foo.egg-info", "foo.egg-info", is_dir=False)
-        ba_rules = [r for r in result if r.name == "Python Egg Info"]
-        assert ba_rules == []
+def test_compile_ruleset_memoized_on_rule_values() -> None:
+    first = compile_ruleset([_rule("r", "**/*.log")])
+    second = compile_ruleset([_rule("r", "**/*.log")])
+    assert first is second
 
-    def test_tox(self, default_ruleset: CompiledRuleSet) -> None:
-        result = _matches(default_ruleset, "/a/.tox/py39/lib/foo", "foo", is_dir=False)
-        assert any(r.category == InsightCategory.BUILD_ARTIFACT for r in result)
 
-    def test_rust_target(self, default_ruleset: CompiledRuleSet) -> None:
-        result = _matches(default_ruleset, "/a/target/release/bin", "bin", is_dir=False)
-        assert any(r.category == InsightCategory.BUILD_ARTIFACT for r in result)
+def test_compile_ruleset_cache_ignores_later_mutation() -> None:
+    rule = _rule("memo-mutation", "**/*.memo")
+    rs = compile_ruleset([rule])
+    rule.pattern = "**/*.other"
+    assert match_all(rs, "/a/b.memo", "b.memo", is_dir=False) == [_rule("memo-mutation", "**/*.memo")]
+    assert compile_ruleset([rule]) is not rs
 
 
-def test_case_insensitive_through_pipeline(default_ruleset: CompiledRuleSet) -> None:
-    path = "/A/NODE_MODULES/foo"
-    result = match_all(default_ruleset, path.lower(), "foo", is_dir=False)
-    assert any(r.category == InsightCategory.BUILD_ARTIFACT for r in result)
+def test_compiled_rule_names_are_interned() -> None:
+    # Concatenated at runtime, so each name is a distinct, non-interned str.
+    prefix = "Interned"
+    name_a = prefix + " name"
+    name_b = prefix + " name"
+    assert name_a is not name_b
+    rs = compile_ruleset([_rule(name_a, "**/*.intern-a"), _rule(name_b, "**/*.intern-b")])
+    (hit_a,) = match_all(rs, "/x/f.intern-a", "f.intern-a", is_dir=False)
+    (hit_b,) = match_all(rs, "/x/f.intern-b", "f.intern-b", is_dir=False)
+    assert hit_a.name is hit_b.name
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dux.config.schema import PatternRule
 from dux.models.enums import ApplyTo, InsightCategory
-from dux.services.patterns import _classify, _match_pattern_slow, compile_ruleset, match_all
+from dux.services.patterns import _classify, _glob_regex, compile_ruleset, match_all
 
 _GLOB = 4
 
@@ -25,18 +25,34 @@ class TestClassifyGlobFallback:
         assert m.kind == _GLOB
 
 
-class TestMatchPatternSlow:
+class TestSinglePatternMatch:
     def test_dir_pattern_matches_normalized(self) -> None:
-        assert _match_pattern_slow("**/tmp/**", "/root/tmp/foo", "foo") is True
+        rs = compile_ruleset([_rule(pattern="**/tmp/**")])
+        assert len(match_all(rs, "/root/tmp/foo", "foo", False)) == 1
 
     def test_full_path_match(self) -> None:
-        assert _match_pattern_slow("**/*.log", "/root/app.log", "app.log") is True
+        rs = compile_ruleset([_rule(pattern="**/*.log")])
+        assert len(match_all(rs, "/root/app.log", "app.log", False)) == 1
 
     def test_basename_match(self) -> None:
-        assert _match_pattern_slow("*.txt", "/root/notes.txt", "notes.txt") is True
+        rs = compile_ruleset([_rule(pattern="*.txt")])
+        assert len(match_all(rs, "/root/notes.txt", "notes.txt", False)) == 1
 
     def test_no_match(self) -> None:
-        assert _match_pattern_slow("*.py", "/root/notes.txt", "notes.txt") is False
+        rs = compile_ruleset([_rule(pattern="*.py")])
+        assert match_all(rs, "/root/notes.txt", "notes.txt", False) == []
+
+
+class TestGlobRegex:
+    def test_path_side_has_no_end_anchor(self) -> None:
+        path_side = _glob_regex("a/*").split(r"\x00", 1)[0]
+        assert r"\Z" not in path_side
+        assert r"\z" not in path_side
+
+    def test_dir_base_side_has_no_end_anchor(self) -> None:
+        path_side = _glob_regex("a/b/**").split(r"\x00", 1)[0]
+        assert r"\Z" not in path_side
+        assert r"\z" not in path_side
 
 
 class TestCompileRulesetGlob:
@@ -52,6 +68,39 @@ class TestCompileRulesetGlob:
         assert len(hits) == 1
         assert hits[0].name == "test"
 
+    def test_first_glob_rule_per_category_wins(self) -> None:
+        rules = [
+            PatternRule("first", "foo/*.log", InsightCategory.TEMP),
+            PatternRule("second", "foo/app.*", InsightCategory.TEMP),
+            PatternRule("other", "foo/?pp.log", InsightCategory.CACHE),
+        ]
+        rs = compile_ruleset(rules)
+        assert len(rs.for_file.glob) == 2
+        hits = match_all(rs, "foo/app.log", "app.log", False)
+        assert sorted(h.name for h in hits) == ["first", "other"]
+
+    def test_later_glob_rule_matches_when_earlier_does_not(self) -> None:
+        rules = [
+            PatternRule("first", "foo/*.log", InsightCategory.TEMP),
+            PatternRule("second", "bar/*.log", InsightCategory.TEMP),
+        ]
+        rs = compile_ruleset(rules)
+        hits = match_all(rs, "bar/app.log", "app.log", False)
+        assert [h.name for h in hits] == ["second"]
+
+    def test_trailing_double_star_matches_directory_itself(self) -> None:
+        rule = PatternRule("test", "foo/b?r/**", InsightCategory.TEMP, apply_to=ApplyTo.DIR)
+        rs = compile_ruleset([rule])
+        assert len(match_all(rs, "foo/bar", "bar", True)) == 1
+        assert len(match_all(rs, "foo/bar/x", "x", True)) == 1
+        assert match_all(rs, "foo/baz", "baz", True) == []
+
+    def test_basename_side_does_not_span_path(self) -> None:
+        rule = PatternRule("test", "a*b", InsightCategory.TEMP)
+        rs = compile_ruleset([rule])
+        assert match_all(rs, "/x/a/yb", "yb", False) == []
+        assert len(match_all(rs, "/x/ab", "ab", False)) == 1
+
 
 class TestApplyToDirMatching:
     def test_dir_only_rule_matches_dir(self) -> None:
@@ -71,3 +120,15 @@ class TestApplyToDirMatching:
         rs = compile_ruleset([rule])
         hits = match_all(rs, "/r/app.log", "app.log", True)
         assert len(hits) == 0
+
+
+class TestNonAsciiPaths:
+    def test_endswith_under_non_ascii_dir(self) -> None:
+        rs = compile_ruleset([_rule("log", "**/*.log")])
+        hits = match_all(rs, "/home/ü/app.log", "app.log", False)
+        assert [h.name for h in hits] == ["log"]
+
+    def test_contains_alt_under_non_ascii_dir(self) -> None:
+        rs = compile_ruleset([_rule("tmp", "**/tmp/**")])
+        hits = match_all(rs, "/home/ü/tmp", "tmp", True)
+        assert [h.name for h in hits] == ["tmp"]
@@ -74,3 +74,11 @@ def test_case_sensitivity() -> None:
     pt.build()
     assert pt.iter("ABC") == []
     assert pt.iter("abc") == [1]
+
+
+def test_iter_rejects_non_str() -> None:
+    pt = PrefixTrie()
+    pt.add_prefix("a", 1)
+    pt.build()
+    with pytest.raises(TypeError, match="must be str, not bytes"):
+        pt.iter(b"a")  # type: ignore[arg-type]
@@ -124,8 +124,12 @@ class TestRenderFocusedSummary:
             Insight("/r/.cache/b", 200, InsightCategory.CACHE, "cache", disk_usage=200),
         ]
         by_cat = {
-            InsightCategory.TEMP: CategoryStats(count=1, size_bytes=100, disk_usage=100, paths={"/r/tmp/a"}),
-            InsightCategory.CACHE: CategoryStats(count=1, size_bytes=200, disk_usage=200, paths={"/r/.cache/b"}),
+            InsightCategory.TEMP: CategoryStats(
+                count=1, size_bytes=100, disk_usage=100, path_hashes={hash("/r/tmp/a")}
+            ),
+            InsightCategory.CACHE: CategoryStats(
+                count=1, size_bytes=200, disk_usage=200, path_hashes={hash("/r/.cache/b")}
+            ),
             InsightCategory.BUILD_ARTIFACT: CategoryStats(),
         }
         return InsightBundle(insights=insights, by_category=by_cat)
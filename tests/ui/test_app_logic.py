@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import pytest
+
+import dux.ui.app as app_module
 from dux.config.schema import AppConfig
 from dux.models.enums import InsightCategory, NodeKind
 from dux.models.insight import CategoryStats, Insight, InsightBundle
 from dux.models.scan import ScanNode, ScanStats
 from dux.services.tree import finalize_sizes
-from dux.ui.app import DuxApp, _PagedState
+from dux.ui.app import DuxApp, _distinct_count, _native_clipboard_command, _PagedState, _tab_bar, _table_cells
+from dux.ui.views import DisplayRow
 from tests.factories import make_dir, make_file
 
 
@@ -52,16 +56,36 @@ class TestRelativePath:
 class TestIndexTree:
     def test_all_nodes_indexed(self) -> None:
         app = _make_app()
-        assert "/r" in app.node_by_path
-        assert "/r/a.txt" in app.node_by_path
+        for path in ("/r", "/r/a.txt", "/r/sub", "/r/sub/c.txt"):
+            node = app._lookup_node(path)
+            assert node is not None
+            assert node.path == path
+
+    def test_index_is_lazy(self) -> None:
+        app = _make_app()
+        assert set(app.node_by_path) == {"/r"}
+        app._lookup_node("/r/a.txt")
         assert "/r/sub" in app.node_by_path
-        assert "/r/sub/c.txt" in app.node_by_path
+        assert "/r/sub/c.txt" not in app.node_by_path
 
-    def test_parent_by_path(self) -> None:
+    def test_missing_paths(self) -> None:
         app = _make_app()
-        assert app.parent_by_path["/r/a.txt"] == "/r"
-        assert app.parent_by_path["/r/sub/c.txt"] == "/r/sub"
-        assert "/r" not in app.parent_by_path  # root has no parent
+        assert app._lookup_node("/r/nope") is None
+        assert app._lookup_node("/r/a.txt/x") is None
+        assert app._lookup_node("/other") is None
+
+    def test_parent_path(self) -> None:
+        app = _make_app()
+        assert app._parent_path("/r/a.txt") == "/r"
+        assert app._parent_path("/r/sub/c.txt") == "/r/sub"
+        assert app._parent_path("/r") is None  # root has no parent
+
+    def test_parent_path_of_filesystem_root_child(self) -> None:
+        child = make_file("/a.txt", du=1)
+        root = make_dir("/", du=1, children=[child])
+        app = _make_app(root=root)
+        assert app._parent_path("/a.txt") == "/"
+        assert app._parent_path("/") is None
 
 
 class TestOverviewRows:
@@ -107,6 +131,18 @@ class TestBrowseRows:
         assert "▼" in root_row.name  # expanded
         assert "▶" in sub_row.name  # collapsed
 
+    def test_indent_beyond_cached_depth(self) -> None:
+        dirs = ["/r" + "/d" * depth for depth in range(1, 71)]
+        node = make_file(dirs[-1] + "/f", du=1)
+        for path in reversed(dirs):
+            node = make_dir(path, du=1, children=[node])
+        root = make_dir("/r", du=1, children=[node])
+        app = _make_app(root=root)
+        app.expanded.update(dirs)
+        rows = app._browse_rows()
+        assert rows[70].name == "  " * 70 + "▼ d"
+        assert rows[71].name == "  " * 71 + "  f"
+
 
 class TestInsightRows:
     def test_returns_matching_insights(self) -> None:
@@ -129,13 +165,95 @@ class TestTopNodesRows:
         app = _make_app()
         rows = app._top_nodes_rows(NodeKind.FILE)
         assert len(rows) > 0
-        assert all(app.node_by_path[r.path].kind is NodeKind.FILE for r in rows)
+        for r in rows:
+            node = app._lookup_node(r.path)
+            assert node is not None
+            assert node.kind is NodeKind.FILE
 
     def test_returns_top_dirs(self) -> None:
         app = _make_app()
         rows = app._top_nodes_rows(NodeKind.DIRECTORY)
         assert len(rows) > 0
 
+    def test_overview_and_large_dir_share_one_walk(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls: list[tuple[int, NodeKind | None]] = []
+        real_top_nodes = app_module.top_nodes
+
+        def counting_top_nodes(root: ScanNode, n: int, kind: NodeKind | None = None) -> list[ScanNode]:
+            calls.append((n, kind))
+            return real_top_nodes(root, n, kind)
+
+        monkeypatch.setattr(app_module, "top_nodes", counting_top_nodes)
+        app = _make_app()
+        app._overview_rows()
+        app._top_nodes_rows(NodeKind.DIRECTORY)
+        assert calls == [(max(app._overview_top, app._top_n_limit), NodeKind.DIRECTORY)]
+
+    def test_walk_runs_outside_the_lock(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        app = _make_app()
+        real_top_nodes = app_module.top_nodes
+        lock_held: list[bool] = []
+
+        def recording_top_nodes(root: ScanNode, n: int, kind: NodeKind | None = None) -> list[ScanNode]:
+            lock_held.append(app._top_nodes_lock.locked())
+            return real_top_nodes(root, n, kind)
+
+        monkeypatch.setattr(app_module, "top_nodes", recording_top_nodes)
+        first = app._top_nodes(NodeKind.FILE)
+        assert app._top_nodes(NodeKind.FILE) is first
+        assert lock_held == [False]
+
+
+class TestRowIndex:
+    def test_first_occurrence_wins(self) -> None:
+        app = _make_app()
+        rows = [DisplayRow("", "a", 0), DisplayRow("/r/x", "x", 0), DisplayRow("", "b", 0)]
+        assert app._row_index(rows, "") == 0
+        assert app._row_index(rows, "/r/x") == 1
+        assert app._row_index(rows, "/r/missing") is None
+
+    def test_map_follows_row_list_identity(self) -> None:
+        app = _make_app()
+        rows = [DisplayRow("/r/x", "x", 0)]
+        assert app._row_index(rows, "/r/x") == 0
+        other = [DisplayRow("/r/y", "y", 0), DisplayRow("/r/x", "x", 0)]
+        assert app._row_index(other, "/r/x") == 1
+
+
+class TestTabBar:
+    def test_reused_per_active_tab(self) -> None:
+        assert _tab_bar("browse") is _tab_bar("browse")
+        assert _tab_bar("browse") is not _tab_bar("temp")
+
+    def test_lists_every_tab(self) -> None:
+        plain = _tab_bar("overview").plain
+        assert "Overview" in plain
+        assert "Temporary Files" in plain
+
+
+class TestDistinctCount:
+    def test_disjoint_sets(self) -> None:
+        assert _distinct_count([{1, 2}, {3}, set()]) == 3
+
+    def test_overlapping_sets(self) -> None:
+        assert _distinct_count([{1, 2}, {2, 3}, {3}]) == 3
+
+
+class TestTableCells:
+    def test_bar_layout(self) -> None:
+        rows = [DisplayRow(path="/r/a", name="a", size_bytes=10, disk_usage=2048), DisplayRow(".", "empty", 0)]
+        cells = _table_cells(rows, is_temp=False, apparent_size=True, total=4096)
+        assert len(cells[0]) == 4
+        assert cells[0][0] == "a"
+        assert cells[0][3] != ""
+        assert cells[1] == ("empty", "", "", "")
+
+    def test_temp_layout(self) -> None:
+        rows = [DisplayRow(path="/r/a", name="a", size_bytes=10, type_label="Dir", category="Temp", disk_usage=1)]
+        cells = _table_cells(rows, is_temp=True, apparent_size=False, total=1)
+        assert len(cells[0]) == 4
+        assert cells[0][2:] == ("Dir", "Temp")
+
 
 class TestFilteredRows:
     def test_no_filter_returns_all(self) -> None:
@@ -158,6 +276,32 @@ class TestFilteredRows:
         result = app._filtered_rows("overview", rows)
         assert result is app._views["overview"].filtered_cache.rows  # type: ignore[union-attr]
 
+    def test_lowered_keys_reused_across_filters(self) -> None:
+        app = _make_app()
+        vs = app._views["overview"]
+        rows = app._overview_rows()
+        vs.filter_text = "TOTAL"
+        assert [r.name for r in app._filtered_rows("overview", rows)] == [rows[0].name]
+        assert vs.filtered_cache is not None
+        lowered = vs.filtered_cache.lowered
+        assert lowered is not None
+        vs.filter_text = "files"
+        assert [r.name for r in app._filtered_rows("overview", rows)] == [rows[1].name]
+        assert vs.filtered_cache.lowered is lowered
+
+    def test_extended_filter_narrows_previous_matches(self) -> None:
+        app = _make_app()
+        vs = app._views["overview"]
+        rows = app._overview_rows()
+        vs.filter_text = "e"
+        broad = app._filtered_rows("overview", rows)
+        vs.filter_text = "Es"
+        narrow = app._filtered_rows("overview", rows)
+        assert narrow == [r for r in broad if "es" in r.name.lower() or "es" in r.path.lower()]
+        assert narrow == [r for r in rows if "es" in r.name.lower() or "es" in r.path.lower()]
+        vs.filter_text = "x"
+        assert app._filtered_rows("overview", rows) == [r for r in rows if "x" in r.name.lower()]
+
 
 class TestInvalidateRows:
     def test_clears_caches(self) -> None:
@@ -186,9 +330,15 @@ class TestBuildAllPagedRows:
             Insight("/r/nm", 300, InsightCategory.BUILD_ARTIFACT, "nm", disk_usage=300),
         ]
         by_cat = {
-            InsightCategory.TEMP: CategoryStats(count=1, size_bytes=100, disk_usage=100, paths={"/r/tmp/a"}),
-            InsightCategory.CACHE: CategoryStats(count=1, size_bytes=200, disk_usage=200, paths={"/r/.cache/b"}),
-            InsightCategory.BUILD_ARTIFACT: CategoryStats(count=1, size_bytes=300, disk_usage=300, paths={"/r/nm"}),
+            InsightCategory.TEMP: CategoryStats(
+                count=1, size_bytes=100, disk_usage=100, path_hashes={hash("/r/tmp/a")}
+            ),
+            InsightCategory.CACHE: CategoryStats(
+                count=1, size_bytes=200, disk_usage=200, path_hashes={hash("/r/.cache/b")}
+            ),
+            InsightCategory.BUILD_ARTIFACT: CategoryStats(
+                count=1, size_bytes=300, disk_usage=300, path_hashes={hash("/r/nm")}
+            ),
         }
         bundle = InsightBundle(insights=insights, by_category=by_cat)
         app = _make_app(bundle=bundle)
@@ -206,6 +356,25 @@ class TestBuildAllPagedRows:
         rows, total = app._build_all_paged_rows("large_file")
         assert total == app.stats.files
 
+    def test_install_prewarmed_rows(self) -> None:
+        app = _make_app()
+        state = app._views["large_file"].paged
+        assert state is not None
+        rows, total = app._build_all_paged_rows("large_file")
+        app._install_paged_rows("large_file", state, rows, total)
+        assert state.all_rows is rows
+        assert state.total_items == total
+
+    def test_install_skips_invalidated_state(self) -> None:
+        app = _make_app()
+        stale = app._views["large_file"].paged
+        assert stale is not None
+        app._invalidate_rows("large_file")
+        app._install_paged_rows("large_file", stale, [], 0)
+        fresh = app._views["large_file"].paged
+        assert fresh is not None
+        assert fresh.all_rows is None
+
 
 class TestTrimmedIndicator:
     def test_non_paged_returns_empty(self) -> None:
@@ -290,3 +459,71 @@ class TestCategorySizeAndDiskUsage:
         sz, du = _category_bytes(by_cat, InsightCategory.TEMP)
         assert sz == 0
         assert du == 0
+
+
+class TestClipboard:
+    def test_ssh_session_uses_osc52(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("SSH_TTY", "/dev/pts/0")
+        assert _native_clipboard_command() is None
+
+    def test_missing_tool_uses_osc52(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("SSH_TTY", raising=False)
+        monkeypatch.delenv("SSH_CONNECTION", raising=False)
+        monkeypatch.setattr(app_module.shutil, "which", lambda _name: None)
+        assert _native_clipboard_command() is None
+
+    def test_darwin_uses_resolved_pbcopy(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("SSH_TTY", raising=False)
+        monkeypatch.delenv("SSH_CONNECTION", raising=False)
+        monkeypatch.setattr(app_module.sys, "platform", "darwin")
+        monkeypatch.setattr(app_module.shutil, "which", lambda name: f"/usr/bin/{name}")
+        assert _native_clipboard_command() == ["/usr/bin/pbcopy"]
+
+    def test_local_tool_resolved_once_per_app(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("SSH_TTY", raising=False)
+        monkeypatch.delenv("SSH_CONNECTION", raising=False)
+        lookups: list[str] = []
+
+        def which(name: str) -> str:
+            lookups.append(name)
+            return f"/usr/bin/{name}"
+
+        runs: list[bytes] = []
+        monkeypatch.setattr(app_module.shutil, "which", which)
+        monkeypatch.setattr(app_module.subprocess, "run", lambda _cmd, *, input, check: runs.append(input))
+        app = _make_app()
+        assert app._copy_to_clipboard("/r/a.txt") is True
+        assert app._copy_to_clipboard("/r/b.txt") is True
+        assert len(lookups) == 1
+        assert runs == [b"/r/a.txt", b"/r/b.txt"]
+
+    def test_osc52_copy(self) -> None:
+        app = _make_app()
+        app._clipboard_cmd = None
+        assert app._copy_to_clipboard("/r/a.txt") is True
+        assert app.clipboard == "/r/a.txt"
+
+
+class TestPressG:
+    def test_second_g_within_deadline_jumps_to_top(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        app = _make_app()
+        moved: list[bool] = []
+        monkeypatch.setattr(app, "_move_top", lambda: moved.append(True))
+        monkeypatch.setattr(app_module.time, "monotonic", lambda: 10.0)
+        app._press_g()
+        assert app.pending_g is True
+        monkeypatch.setattr(app_module.time, "monotonic", lambda: 10.4)
+        app._press_g()
+        assert moved == [True]
+        assert app.pending_g is False
+
+    def test_second_g_after_deadline_starts_over(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        app = _make_app()
+        moved: list[bool] = []
+        monkeypatch.setattr(app, "_move_top", lambda: moved.append(True))
+        monkeypatch.setattr(app_module.time, "monotonic", lambda: 10.0)
+        app._press_g()
+        monkeypatch.setattr(app_module.time, "monotonic", lambda: 10.6)
+        app._press_g()
+        assert moved == []
+        assert app.pending_g is True
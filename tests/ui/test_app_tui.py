@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import pytest
+from textual.widgets import DataTable
 
 from dux.config.schema import AppConfig
 from dux.models.enums import InsightCategory, NodeKind
@@ -24,9 +25,11 @@ def _make_app(apparent_size: bool = False) -> DuxApp:
         Insight("/r/sub", 50, InsightCategory.BUILD_ARTIFACT, "build", kind=NodeKind.DIRECTORY, disk_usage=50),
     ]
     by_cat = {
-        InsightCategory.TEMP: CategoryStats(count=1, size_bytes=100, disk_usage=100, paths={"/r/a.txt"}),
+        InsightCategory.TEMP: CategoryStats(count=1, size_bytes=100, disk_usage=100, path_hashes={hash("/r/a.txt")}),
         InsightCategory.CACHE: CategoryStats(),
-        InsightCategory.BUILD_ARTIFACT: CategoryStats(count=1, size_bytes=50, disk_usage=50, paths={"/r/sub"}),
+        InsightCategory.BUILD_ARTIFACT: CategoryStats(
+            count=1, size_bytes=50, disk_usage=50, path_hashes={hash("/r/sub")}
+        ),
     }
     bundle = InsightBundle(insights=insights, by_category=by_cat)
     config = AppConfig(page_size=50, max_insights_per_category=100, overview_top_dirs=10, scroll_step=5)
@@ -223,6 +226,27 @@ async def test_browse_collapse_or_parent() -> None:
         assert app.selected_index <= old_idx
 
 
+@pytest.mark.asyncio
+async def test_in_view_updates_skip_header() -> None:
+    app = _make_app()
+    async with app.run_test(size=(120, 40)) as pilot:
+        await pilot.press("b")
+        headers: list[str] = []
+        original = app._render_header_rows
+
+        def counting_header() -> None:
+            headers.append(app.current_view)
+            original()
+
+        app._render_header_rows = counting_header  # type: ignore[method-assign]
+        await pilot.press("j")
+        await pilot.press("l")
+        await pilot.press("h")
+        assert headers == []
+        await pilot.press("o")
+        assert headers == ["overview"]
+
+
 @pytest.mark.asyncio
 async def test_resize_triggers_refresh() -> None:
     app = _make_app()
@@ -230,3 +254,46 @@ async def test_resize_triggers_refresh() -> None:
         # Just verifying it doesn't crash
         await pilot.resize_terminal(80, 30)
         assert len(app.rows) > 0
+
+
+@pytest.mark.asyncio
+async def test_resize_burst_coalesces_into_one_refresh() -> None:
+    app = _make_app()
+    async with app.run_test(size=(120, 40)) as pilot:
+        table = app.query_one("#content-table", DataTable)
+        refreshes: list[int] = []
+        original = app._refresh_all
+
+        def counting_refresh() -> None:
+            refreshes.append(app.size.width)
+            original()
+
+        app._refresh_all = counting_refresh  # type: ignore[method-assign]
+        await pilot.resize_terminal(100, 40)
+        await pilot.resize_terminal(90, 40)
+        await pilot.pause(0.2)
+        assert refreshes == [90]
+        assert table.ordered_columns[0].width == app._table_columns[0][1]
+
+
+@pytest.mark.asyncio
+async def test_paged_views_prewarmed_on_mount() -> None:
+    app = _make_app()
+    async with app.run_test(size=(120, 40)) as pilot:
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        for view in ("large_dir", "large_file", "temp"):
+            state = app._views[view].paged
+            assert state is not None
+            assert state.all_rows is not None
+
+
+@pytest.mark.asyncio
+async def test_footer_shows_filter_text_literally() -> None:
+    app = _make_app()
+    async with app.run_test(size=(160, 40)) as pilot:
+        await pilot.press("b")
+        app._on_search_result("[sub]")
+        await pilot.pause()
+        assert app._footer_status is not None
+        assert "Filter: '[sub]'" in app._footer_status